@@ -2,183 +2,419 @@
 Database module for Ppodo application.
 Manages SQLite database with tables for tasks, sessions, stats, profile, and badges.
 """
-import sqlite3
-from datetime import datetime, date
+import queue
+import sys
+import threading
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import accumulate
+from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
+
+# Prefer pysqlite3 when installed: it bundles a current SQLite with a raised
+# mmap limit; the stdlib module is API-compatible and used otherwise.
+try:
+    from pysqlite3 import dbapi2 as sqlite3
+    _PYSQLITE3 = True
+except ImportError:
+    import sqlite3
+    _PYSQLITE3 = False
+
+# Memory-map window for database pages; pysqlite3 on 64-bit hosts allows
+# more than the stdlib build's default ceiling.
+_MMAP_SIZE = 1 << 32 if _PYSQLITE3 and sys.maxsize > 2 ** 32 else 268435456
+
+# Connection tuning applied right after connect: WAL journaling with
+# synchronous=NORMAL avoids an fsync per commit, and the larger page cache
+# plus mmap keeps hot pages out of read() syscalls.
+_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-20000",
+    f"mmap_size={_MMAP_SIZE}",
+)
+
+# Hot statements shared across call sites. sqlite3 caches compiled statements
+# per connection keyed by the exact SQL text, so reusing one string per
+# statement keeps every call on the same prepared statement.
+_SQL_ADD_TASK = "INSERT INTO tasks (title) VALUES (?)"
+_SQL_COMPLETE_TASK = """
+    UPDATE tasks SET completed = 1, completed_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+_SQL_START_SESSION = """
+    INSERT INTO focus_sessions (task_id, started_at, duration_minutes)
+    VALUES (?, CURRENT_TIMESTAMP, ?)
+"""
+_SQL_COMPLETE_SESSION = """
+    UPDATE focus_sessions
+    SET completed = 1, ended_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+_SQL_UPSERT_GRAPE_STATS = """
+    INSERT INTO grape_stats
+    (date, grapes_earned, bunches_completed, boxes_completed, focus_minutes)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        grapes_earned = grapes_earned + excluded.grapes_earned,
+        bunches_completed = bunches_completed + excluded.bunches_completed,
+        boxes_completed = boxes_completed + excluded.boxes_completed,
+        focus_minutes = focus_minutes + excluded.focus_minutes
+"""
+_SQL_UPSERT_TASK_MINUTES = """
+    INSERT INTO task_daily_minutes (date, task_id, minutes)
+    VALUES (?, ?, ?)
+    ON CONFLICT(date, task_id) DO UPDATE SET minutes = minutes + excluded.minutes
+"""
+_SQL_SESSION_INFO = "SELECT task_id, duration_minutes FROM focus_sessions WHERE id = ?"
+_SQL_GET_PROFILE = "SELECT * FROM user_profile WHERE id = 1"
+# UPDATE ... RETURNING needs SQLite 3.35+; older libraries re-read the profile
+_SQL_RETURNING_PROFILE = " RETURNING *" if sqlite3.sqlite_version_info >= (3, 35, 0) else ""
+
+# Seed rows for badge_definitions:
+# (name, description, icon, category, condition_type, condition_value)
+_BADGE_SEED: Tuple[Tuple[str, str, str, str, str, int], ...] = (
+    # Milestone badges
+    ("첫 걸음", "포도알 1개 획득", "🌱", "마일스톤", "grapes", 1),
+    ("첫 송이", "포도송이 1개 완성", "🍇", "마일스톤", "bunches", 1),
+    ("첫 상자", "포도상자 1개 완성", "📦", "마일스톤", "boxes", 1),
+
+    # Streak badges
+    ("일주일 연속", "7일 연속 집중", "🔥", "연속성", "streak", 7),
+    ("끈기왕", "50일 연속 집중", "💪", "연속성", "streak", 50),
+
+    # Daily achievement badges
+    ("집중왕", "하루 10개 포도알", "⚡", "일간 성과", "daily_grapes", 10),
+    ("한 달 마스터", "한 달 중 25일 집중", "👑", "일간 성과", "monthly_days", 25),
+
+    # Collection badges
+    ("백전노장", "포도알 100개 획득", "💯", "수집", "grapes", 100),
+    ("포도농장", "포도상자 10개 완성", "🏭", "수집", "boxes", 10),
+    ("전설", "포도알 1000개 획득", "🏆", "수집", "grapes", 1000),
+
+    # Time-based badges
+    ("새벽형 인간", "오전 6-9시 집중", "🌅", "시간대", "morning_sessions", 10),
+    ("올빼미족", "밤 10시 이후 집중", "🦉", "시간대", "night_sessions", 10),
+
+    # Level badge
+    ("레벨 마스터", "레벨 10 달성", "⭐", "레벨", "level", 10),
+
+    # Task badge
+    ("완벽주의자", "할 일 100개 완료", "✅", "태스크", "tasks_completed", 100),
+
+    # Time badge
+    ("시간여행자", "총 100시간 집중", "⏰", "시간", "total_hours", 100),
+)
+
+# XP required to advance from level N to N+1 is _LEVEL_REQ[N - 1];
+# _LEVEL_CUM[N - 1] is the total XP needed to reach level N.
+_LEVEL_REQ = tuple(int(100 * (1.5 ** i)) for i in range(128))
+_LEVEL_CUM = tuple(accumulate(_LEVEL_REQ, initial=0))
+
+
+# grape_stats.date and user_profile.last_focus_date are stored as INTEGER
+# days since the Unix epoch, which compare and index cheaper than TEXT dates.
+_EPOCH = date(1970, 1, 1)
+
+
+def _epoch_day(d: date) -> int:
+    """Convert a date to days since the Unix epoch."""
+    return (d - _EPOCH).days
+
+
+def _from_epoch_day(days: int) -> date:
+    """Convert days since the Unix epoch back to a date."""
+    return _EPOCH + timedelta(days=days)
 
 
 class Database:
-    """SQLite database manager for Ppodo."""
+    """SQLite database manager for Ppodo.
+
+    Query methods return sqlite3.Row objects, which support both
+    row['column'] and index access.
+    """
 
-    def __init__(self, db_path: str = "ppodo.db"):
-        """Initialize database connection and create tables if needed."""
+    def __init__(self, db_path: str = "ppodo.db", pragmas: Tuple[str, ...] = _PRAGMAS,
+                 read_pool_size: int = 4):
+        """
+        Initialize database connection and create tables if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+            pragmas: PRAGMA statements applied to the connection after opening
+            read_pool_size: Number of read-only connections used for queries
+        """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # Autocommit mode: single statements commit on their own, and
+        # multi-statement work is grouped explicitly with transaction().
+        # The writer may be used from a worker thread (see
+        # submit_session_completion); _write_lock serializes access to it.
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False,
+                                    cached_statements=256)
+        self._write_lock = threading.RLock()
+        self._tx_thread: Optional[int] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Bumped after every committed write, so views can skip re-reading
+        # when nothing has changed since they last rendered
+        self.version = 0
+        for pragma in pragmas:
+            self.conn.execute("PRAGMA " + pragma)
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
         self._create_tables()
         self._migrate_database()
         self._initialize_badge_definitions()
         self._initialize_user_profile()
+        self._analyze_if_needed()
+        self._read_pool = self._open_read_pool(read_pool_size)
 
-    def _create_tables(self):
-        """Create all required tables."""
-        # Tasks table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                completed BOOLEAN DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                completed_at TIMESTAMP
-            )
-        """)
-
-        # Focus sessions table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS focus_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task_id INTEGER,
-                started_at TIMESTAMP NOT NULL,
-                ended_at TIMESTAMP,
-                duration_minutes INTEGER DEFAULT 25,
-                completed BOOLEAN DEFAULT 0,
-                FOREIGN KEY (task_id) REFERENCES tasks(id)
-            )
-        """)
-
-        # Grape stats table (daily statistics)
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS grape_stats (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date DATE NOT NULL UNIQUE,
-                grapes_earned INTEGER DEFAULT 0,
-                bunches_completed INTEGER DEFAULT 0,
-                boxes_completed INTEGER DEFAULT 0
-            )
-        """)
-
-        # User profile table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_profile (
-                id INTEGER PRIMARY KEY CHECK (id = 1),
-                level INTEGER DEFAULT 1,
-                xp INTEGER DEFAULT 0,
-                total_grapes INTEGER DEFAULT 0,
-                total_bunches INTEGER DEFAULT 0,
-                total_boxes INTEGER DEFAULT 0,
-                current_bunch_grapes INTEGER DEFAULT 0,
-                current_box_bunches INTEGER DEFAULT 0,
-                total_focus_minutes INTEGER DEFAULT 0,
-                streak_days INTEGER DEFAULT 0,
-                last_focus_date DATE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Badge definitions table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS badge_definitions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                description TEXT NOT NULL,
-                icon TEXT NOT NULL,
-                category TEXT NOT NULL,
-                condition_type TEXT NOT NULL,
-                condition_value INTEGER NOT NULL
-            )
-        """)
-
-        # User badges table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_badges (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                badge_id INTEGER NOT NULL,
-                earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (badge_id) REFERENCES badge_definitions(id)
-            )
-        """)
-
-        self.conn.commit()
+    def _open_read_pool(self, size: int) -> Optional[queue.Queue]:
+        """
+        Open read-only connections so queries don't share the writer.
 
-    def _migrate_database(self):
-        """Apply database migrations for new features."""
-        # Add language column to user_profile if it doesn't exist
+        Under WAL, readers never block the writer or each other. In-memory
+        databases can't be shared between connections, so they read through
+        the writer instead.
+
+        Returns:
+            Queue of read-only connections, or None if reads use the writer
+        """
+        if size <= 0 or self.db_path == ":memory:":
+            return None
+
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        pool = queue.Queue()
+        for _ in range(size):
+            conn = sqlite3.connect(uri, uri=True, isolation_level=None,
+                                   check_same_thread=False, cached_statements=256)
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+            conn.row_factory = sqlite3.Row
+            pool.put(conn)
+        return pool
+
+    @contextmanager
+    def _read_conn(self):
+        """
+        Borrow a read-only connection from the pool.
+
+        Inside a write transaction opened by the calling thread the writer
+        is yielded instead, so reads see the transaction's own uncommitted
+        changes.
+        """
+        if self._read_pool is None or self._tx_thread == threading.get_ident():
+            with self._write_lock:
+                yield self.conn
+            return
+
+        conn = self._read_pool.get()
         try:
-            self.cursor.execute("SELECT language FROM user_profile LIMIT 1")
-        except sqlite3.OperationalError:
-            # Column doesn't exist, add it
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    def _analyze_if_needed(self):
+        """Collect planner statistics once so the indexes get picked up."""
+        self.cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        if self.cursor.fetchone()[0] == 0:
+            self.cursor.execute("ANALYZE")
+
+    def _create_tables(self):
+        """Create all required tables."""
+        with self.transaction():
+            # Tasks table
             self.cursor.execute("""
-                ALTER TABLE user_profile ADD COLUMN language TEXT DEFAULT 'ko'
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    completed BOOLEAN DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    completed_at TIMESTAMP
+                )
             """)
-            self.conn.commit()
 
-        # Add wine progression columns if they don't exist
-        try:
-            self.cursor.execute("SELECT total_wine_bottles FROM user_profile LIMIT 1")
-        except sqlite3.OperationalError:
-            # Add wine bottle columns
+            # Focus sessions table
             self.cursor.execute("""
-                ALTER TABLE user_profile ADD COLUMN total_wine_bottles INTEGER DEFAULT 0
+                CREATE TABLE IF NOT EXISTS focus_sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_id INTEGER,
+                    started_at TIMESTAMP NOT NULL,
+                    ended_at TIMESTAMP,
+                    duration_minutes INTEGER DEFAULT 25,
+                    completed BOOLEAN DEFAULT 0,
+                    FOREIGN KEY (task_id) REFERENCES tasks(id)
+                )
             """)
+
+            # Grape stats table (daily statistics)
             self.cursor.execute("""
-                ALTER TABLE user_profile ADD COLUMN total_wine_crates INTEGER DEFAULT 0
+                CREATE TABLE IF NOT EXISTS grape_stats (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date DATE NOT NULL UNIQUE,
+                    grapes_earned INTEGER DEFAULT 0,
+                    bunches_completed INTEGER DEFAULT 0,
+                    boxes_completed INTEGER DEFAULT 0
+                )
             """)
+
+            # User profile table
             self.cursor.execute("""
-                ALTER TABLE user_profile ADD COLUMN current_bottle_boxes INTEGER DEFAULT 0
+                CREATE TABLE IF NOT EXISTS user_profile (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    level INTEGER DEFAULT 1,
+                    xp INTEGER DEFAULT 0,
+                    total_grapes INTEGER DEFAULT 0,
+                    total_bunches INTEGER DEFAULT 0,
+                    total_boxes INTEGER DEFAULT 0,
+                    current_bunch_grapes INTEGER DEFAULT 0,
+                    current_box_bunches INTEGER DEFAULT 0,
+                    total_focus_minutes INTEGER DEFAULT 0,
+                    streak_days INTEGER DEFAULT 0,
+                    last_focus_date DATE,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
             """)
+
+            # Badge definitions table
             self.cursor.execute("""
-                ALTER TABLE user_profile ADD COLUMN current_crate_bottles INTEGER DEFAULT 0
+                CREATE TABLE IF NOT EXISTS badge_definitions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL UNIQUE,
+                    description TEXT NOT NULL,
+                    icon TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    condition_type TEXT NOT NULL,
+                    condition_value INTEGER NOT NULL
+                )
             """)
-            self.conn.commit()
-
-    def _initialize_badge_definitions(self):
-        """Initialize 15 badge definitions if they don't exist."""
-        badges = [
-            # Milestone badges
-            ("첫 걸음", "포도알 1개 획득", "🌱", "마일스톤", "grapes", 1),
-            ("첫 송이", "포도송이 1개 완성", "🍇", "마일스톤", "bunches", 1),
-            ("첫 상자", "포도상자 1개 완성", "📦", "마일스톤", "boxes", 1),
 
-            # Streak badges
-            ("일주일 연속", "7일 연속 집중", "🔥", "연속성", "streak", 7),
-            ("끈기왕", "50일 연속 집중", "💪", "연속성", "streak", 50),
-
-            # Daily achievement badges
-            ("집중왕", "하루 10개 포도알", "⚡", "일간 성과", "daily_grapes", 10),
-            ("한 달 마스터", "한 달 중 25일 집중", "👑", "일간 성과", "monthly_days", 25),
-
-            # Collection badges
-            ("백전노장", "포도알 100개 획득", "💯", "수집", "grapes", 100),
-            ("포도농장", "포도상자 10개 완성", "🏭", "수집", "boxes", 10),
-            ("전설", "포도알 1000개 획득", "🏆", "수집", "grapes", 1000),
+            # User badges table
+            self.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_badges (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    badge_id INTEGER NOT NULL,
+                    earned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (badge_id) REFERENCES badge_definitions(id)
+                )
+            """)
 
-            # Time-based badges
-            ("새벽형 인간", "오전 6-9시 집중", "🌅", "시간대", "morning_sessions", 10),
-            ("올빼미족", "밤 10시 이후 집중", "🦉", "시간대", "night_sessions", 10),
+            # Indexes for the hot filter/join columns
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_fs_started_completed
+                ON focus_sessions(completed, started_at)
+            """)
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_fs_task ON focus_sessions(task_id)
+            """)
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_completed
+                ON tasks(completed, created_at DESC)
+            """)
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_completed_at
+                ON tasks(completed, completed_at)
+            """)
 
-            # Level badge
-            ("레벨 마스터", "레벨 10 달성", "⭐", "레벨", "level", 10),
+    def _migrate_database(self):
+        """Apply database migrations for new features."""
+        with self.transaction():
+            # Add language column to user_profile if it doesn't exist
+            try:
+                self.cursor.execute("SELECT language FROM user_profile LIMIT 1")
+            except sqlite3.OperationalError:
+                # Column doesn't exist, add it
+                self.cursor.execute("""
+                    ALTER TABLE user_profile ADD COLUMN language TEXT DEFAULT 'ko'
+                """)
 
-            # Task badge
-            ("완벽주의자", "할 일 100개 완료", "✅", "태스크", "tasks_completed", 100),
+            # Add wine progression columns if they don't exist
+            try:
+                self.cursor.execute("SELECT total_wine_bottles FROM user_profile LIMIT 1")
+            except sqlite3.OperationalError:
+                # Add wine bottle columns
+                self.cursor.execute("""
+                    ALTER TABLE user_profile ADD COLUMN total_wine_bottles INTEGER DEFAULT 0
+                """)
+                self.cursor.execute("""
+                    ALTER TABLE user_profile ADD COLUMN total_wine_crates INTEGER DEFAULT 0
+                """)
+                self.cursor.execute("""
+                    ALTER TABLE user_profile ADD COLUMN current_bottle_boxes INTEGER DEFAULT 0
+                """)
+                self.cursor.execute("""
+                    ALTER TABLE user_profile ADD COLUMN current_crate_bottles INTEGER DEFAULT 0
+                """)
 
-            # Time badge
-            ("시간여행자", "총 100시간 집중", "⏰", "시간", "total_hours", 100),
-        ]
+            # Add daily focus minutes rollup if it doesn't exist
+            try:
+                self.cursor.execute("SELECT focus_minutes FROM grape_stats LIMIT 1")
+            except sqlite3.OperationalError:
+                self.cursor.execute("""
+                    ALTER TABLE grape_stats ADD COLUMN focus_minutes INTEGER DEFAULT 0
+                """)
+                # Backfill from existing sessions, keyed by local date like new rows
+                self.cursor.execute("""
+                    INSERT INTO grape_stats (date, focus_minutes)
+                    SELECT DATE(started_at, 'localtime'), SUM(duration_minutes)
+                    FROM focus_sessions
+                    WHERE completed = 1
+                    GROUP BY DATE(started_at, 'localtime')
+                    ON CONFLICT(date) DO UPDATE SET focus_minutes = excluded.focus_minutes
+                """)
+
+            # Convert ISO text dates to epoch days (no-op once converted)
+            self.cursor.execute("""
+                UPDATE grape_stats
+                SET date = CAST(julianday(date) - julianday('1970-01-01') AS INTEGER)
+                WHERE typeof(date) = 'text'
+            """)
+            self.cursor.execute("""
+                UPDATE user_profile
+                SET last_focus_date = CAST(julianday(last_focus_date) - julianday('1970-01-01') AS INTEGER)
+                WHERE typeof(last_focus_date) = 'text'
+            """)
 
-        for badge in badges:
+            # Add per-task daily minutes rollup if it doesn't exist
             try:
+                self.cursor.execute("SELECT 1 FROM task_daily_minutes LIMIT 1")
+            except sqlite3.OperationalError:
                 self.cursor.execute("""
-                    INSERT OR IGNORE INTO badge_definitions
-                    (name, description, icon, category, condition_type, condition_value)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, badge)
-            except sqlite3.IntegrityError:
-                pass  # Badge already exists
+                    CREATE TABLE task_daily_minutes (
+                        date INTEGER NOT NULL,
+                        task_id INTEGER NOT NULL,
+                        minutes INTEGER DEFAULT 0,
+                        PRIMARY KEY (date, task_id)
+                    )
+                """)
+                # Backfill from existing sessions, keyed by local epoch day
+                self.cursor.execute("""
+                    INSERT INTO task_daily_minutes (date, task_id, minutes)
+                    SELECT CAST(julianday(started_at, 'localtime', 'start of day')
+                                - julianday('1970-01-01') AS INTEGER) AS day,
+                           task_id, SUM(duration_minutes)
+                    FROM focus_sessions
+                    WHERE completed = 1 AND task_id IS NOT NULL
+                    GROUP BY day, task_id
+                """)
 
-        self.conn.commit()
+    def _initialize_badge_definitions(self):
+        """Initialize 15 badge definitions if they don't exist."""
+        # Already seeded on a previous run: skip the INSERTs entirely
+        self.cursor.execute("SELECT COUNT(*) FROM badge_definitions")
+        if self.cursor.fetchone()[0] >= len(_BADGE_SEED):
+            return
+
+        # One prepared statement for all rows, committed as a single transaction
+        with self.transaction():
+            self.cursor.executemany("""
+                INSERT OR IGNORE INTO badge_definitions
+                (name, description, icon, category, condition_type, condition_value)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, _BADGE_SEED)
 
     def _initialize_user_profile(self):
         """Initialize user profile if it doesn't exist."""
@@ -187,103 +423,234 @@ class Database:
             self.cursor.execute("""
                 INSERT INTO user_profile (id) VALUES (1)
             """)
-            self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several mutations into one transaction.
+
+        The connection runs in autocommit mode, so single-call mutations
+        commit on their own. Inside ``with db.transaction():`` they are
+        committed together on exit, or rolled back if an exception escapes.
+        Nested use joins the outer transaction. The write lock is held for
+        the whole transaction.
+        """
+        with self._write_lock:
+            if self.conn.in_transaction:
+                yield
+                return
+
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._tx_thread = threading.get_ident()
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self.conn.execute("COMMIT")
+                self.version += 1
+            finally:
+                self._tx_thread = None
 
     # ========== Task Management ==========
 
     def add_task(self, title: str) -> int:
         """Add a new task and return its ID."""
-        self.cursor.execute("""
-            INSERT INTO tasks (title) VALUES (?)
-        """, (title,))
-        self.conn.commit()
-        return self.cursor.lastrowid
+        with self._write_lock:
+            self.cursor.execute(_SQL_ADD_TASK, (title,))
+            self.version += 1
+            return self.cursor.lastrowid
+
+    def add_tasks(self, titles: Iterable[str]) -> List[int]:
+        """
+        Add several tasks in one transaction.
+
+        Args:
+            titles: Task titles to add
+
+        Returns:
+            IDs of the new tasks, in the order given
+        """
+        rows = [(title,) for title in titles]
+        if not rows:
+            return []
+
+        with self.transaction():
+            self.cursor.executemany(_SQL_ADD_TASK, rows)
+            # Rowids are consecutive: the write lock is held for the whole batch
+            self.cursor.execute("SELECT last_insert_rowid()")
+            last_id = self.cursor.fetchone()[0]
+
+        return list(range(last_id - len(rows) + 1, last_id + 1))
 
-    def get_tasks(self, completed: Optional[bool] = None) -> List[Dict]:
+    def get_tasks(self, completed: Optional[bool] = None) -> List[sqlite3.Row]:
         """Get all tasks, optionally filtered by completion status."""
-        if completed is None:
-            self.cursor.execute("""
-                SELECT * FROM tasks ORDER BY created_at DESC
-            """)
-        else:
-            self.cursor.execute("""
+        with self._read_conn() as conn:
+            if completed is None:
+                return conn.execute("""
+                    SELECT * FROM tasks ORDER BY created_at DESC
+                """).fetchall()
+
+            return conn.execute("""
                 SELECT * FROM tasks WHERE completed = ? ORDER BY created_at DESC
-            """, (completed,))
+            """, (completed,)).fetchall()
+
+    def get_completed_tasks(self, limit: Optional[int] = None) -> List[sqlite3.Row]:
+        """
+        Get completed tasks, most recently completed first.
+
+        Args:
+            limit: Maximum number of tasks to return (all when None)
+
+        Returns:
+            Completed task rows ordered by completed_at descending
+        """
+        with self._read_conn() as conn:
+            return conn.execute("""
+                SELECT * FROM tasks WHERE completed = 1
+                ORDER BY completed_at DESC LIMIT ?
+            """, (-1 if limit is None else limit,)).fetchall()
 
-        return [dict(row) for row in self.cursor.fetchall()]
+    def get_completed_task_count(self) -> int:
+        """Get the number of completed tasks."""
+        with self._read_conn() as conn:
+            return conn.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1").fetchone()[0]
 
     def complete_task(self, task_id: int):
         """Mark a task as completed."""
-        self.cursor.execute("""
-            UPDATE tasks SET completed = 1, completed_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (task_id,))
-        self.conn.commit()
+        with self._write_lock:
+            self.cursor.execute(_SQL_COMPLETE_TASK, (task_id,))
+            self.version += 1
 
     def delete_task(self, task_id: int):
         """Delete a task."""
-        self.cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        self.conn.commit()
+        with self._write_lock:
+            self.cursor.execute(_SQL_DELETE_TASK, (task_id,))
+            self.version += 1
 
     # ========== Focus Session Management ==========
 
     def start_session(self, task_id: Optional[int] = None, duration: int = 25) -> int:
         """Start a new focus session and return its ID."""
-        self.cursor.execute("""
-            INSERT INTO focus_sessions (task_id, started_at, duration_minutes)
-            VALUES (?, CURRENT_TIMESTAMP, ?)
-        """, (task_id, duration))
-        self.conn.commit()
-        return self.cursor.lastrowid
-
-    def complete_session(self, session_id: int, collect_grape: bool = True):
+        with self._write_lock:
+            self.cursor.execute(_SQL_START_SESSION, (task_id, duration))
+            self.version += 1
+            return self.cursor.lastrowid
+
+    def complete_session(self, session_id: int, collect_grape: bool = True) -> Optional[sqlite3.Row]:
         """
         Mark a session as completed and update stats.
 
         Args:
             session_id: Session ID to complete
             collect_grape: Whether to collect grape (False for sessions < 15 minutes)
-        """
-        self.cursor.execute("""
-            UPDATE focus_sessions
-            SET completed = 1, ended_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (session_id,))
 
+        Returns:
+            Updated profile row if a grape was collected, otherwise None
+        """
         # Update user profile and grape stats only if collect_grape is True
         if collect_grape:
-            self._add_grape()
-            self._update_streak()
+            return self._apply_session_completion(session_id)
+
+        with self.transaction():
+            self.cursor.execute(_SQL_COMPLETE_SESSION, (session_id,))
+            task_id, duration = self._session_info(session_id)
+            today = date.today()
+            self._upsert_grape_stats(today, focus_minutes=duration)
+            self._upsert_task_minutes(today, task_id, duration)
+        return None
 
-        self.conn.commit()
+    def _apply_session_completion(self, session_id: int) -> sqlite3.Row:
+        """
+        Complete a session and apply grape, XP and streak updates at once.
 
-    def get_today_sessions(self) -> List[Dict]:
+        The profile is read once and written once inside a single
+        transaction; the _next_*_state helpers compute the new values.
+
+        Args:
+            session_id: Session ID to complete
+
+        Returns:
+            Updated profile row, so callers don't need to re-read it
+        """
+        with self.transaction():
+            self.cursor.execute(_SQL_COMPLETE_SESSION, (session_id,))
+            task_id, duration = self._session_info(session_id)
+
+            profile = self.get_profile()
+            today = date.today()
+
+            grapes = self._next_grape_state(profile)
+            new_xp, new_level = self._next_level_state(profile['xp'], profile['level'], 10)
+            new_streak = self._next_streak_state(profile['streak_days'],
+                                                 profile['last_focus_date'], today)
+
+            self.cursor.execute("""
+                UPDATE user_profile SET
+                    total_grapes = ?,
+                    total_bunches = ?,
+                    total_boxes = ?,
+                    total_wine_bottles = ?,
+                    total_wine_crates = ?,
+                    current_bunch_grapes = ?,
+                    current_box_bunches = ?,
+                    current_bottle_boxes = ?,
+                    current_crate_bottles = ?,
+                    xp = ?,
+                    level = ?,
+                    streak_days = ?,
+                    last_focus_date = ?
+                WHERE id = 1
+            """ + _SQL_RETURNING_PROFILE, grapes + (new_xp, new_level, new_streak, _epoch_day(today)))
+            updated = self.cursor.fetchone() if _SQL_RETURNING_PROFILE else None
+
+            self._upsert_grape_stats(today, grapes, duration)
+            self._upsert_task_minutes(today, task_id, duration)
+
+        return updated if updated is not None else self.get_profile()
+
+    def get_today_sessions(self) -> List[sqlite3.Row]:
         """Get all completed sessions for today."""
-        today = date.today().isoformat()
-        self.cursor.execute("""
-            SELECT * FROM focus_sessions
-            WHERE DATE(started_at) = ? AND completed = 1
-            ORDER BY started_at DESC
-        """, (today,))
+        # Range comparison instead of DATE(started_at) so the index applies
+        day_start, day_end = self._today_bounds()
+        with self._read_conn() as conn:
+            return conn.execute("""
+                SELECT * FROM focus_sessions
+                WHERE completed = 1 AND started_at >= ? AND started_at < ?
+                ORDER BY started_at DESC
+            """, (day_start, day_end)).fetchall()
+
+    def _today_bounds(self) -> Tuple[str, str]:
+        """
+        Get today's timestamp range for indexable started_at comparisons.
 
-        return [dict(row) for row in self.cursor.fetchall()]
+        Returns:
+            Tuple of (today's midnight, tomorrow's midnight) in ISO format
+        """
+        today = date.today()
+        return today.isoformat(), (today + timedelta(days=1)).isoformat()
 
     # ========== Grape Management ==========
 
-    def _add_grape(self):
-        """Add one grape and handle bunch/box/wine progression."""
-        profile = self.get_profile()
+    def _next_grape_state(self, profile: sqlite3.Row) -> Tuple[int, ...]:
+        """
+        Compute grape/bunch/box/wine progression after adding one grape.
 
-        # Add grape
+        Returns:
+            Tuple of (total_grapes, total_bunches, total_boxes,
+            total_wine_bottles, total_wine_crates, current_bunch_grapes,
+            current_box_bunches, current_bottle_boxes, current_crate_bottles)
+        """
         new_grapes = profile['total_grapes'] + 1
         new_bunch_grapes = profile['current_bunch_grapes'] + 1
         new_bunches = profile['total_bunches']
         new_box_bunches = profile['current_box_bunches']
         new_boxes = profile['total_boxes']
-        new_bottle_boxes = profile.get('current_bottle_boxes', 0)
-        new_bottles = profile.get('total_wine_bottles', 0)
-        new_crate_bottles = profile.get('current_crate_bottles', 0)
-        new_crates = profile.get('total_wine_crates', 0)
+        new_bottle_boxes = profile['current_bottle_boxes']
+        new_bottles = profile['total_wine_bottles']
+        new_crate_bottles = profile['current_crate_bottles']
+        new_crates = profile['total_wine_crates']
 
         # Check if bunch completed (10 grapes)
         if new_bunch_grapes >= 10:
@@ -308,220 +675,285 @@ class Database:
             new_crates += 1
             new_crate_bottles = 0
 
-        # Update profile
-        self.cursor.execute("""
-            UPDATE user_profile SET
-                total_grapes = ?,
-                total_bunches = ?,
-                total_boxes = ?,
-                total_wine_bottles = ?,
-                total_wine_crates = ?,
-                current_bunch_grapes = ?,
-                current_box_bunches = ?,
-                current_bottle_boxes = ?,
-                current_crate_bottles = ?
-            WHERE id = 1
-        """, (new_grapes, new_bunches, new_boxes, new_bottles, new_crates,
-              new_bunch_grapes, new_box_bunches, new_bottle_boxes, new_crate_bottles))
-
-        # Update daily stats
-        today = date.today().isoformat()
-        self.cursor.execute("""
-            INSERT INTO grape_stats (date, grapes_earned, bunches_completed, boxes_completed)
-            VALUES (?, 1, ?, ?)
-            ON CONFLICT(date) DO UPDATE SET
-                grapes_earned = grapes_earned + 1,
-                bunches_completed = bunches_completed + excluded.bunches_completed,
-                boxes_completed = boxes_completed + excluded.boxes_completed
-        """, (today, 1 if new_bunch_grapes == 0 else 0, 1 if new_box_bunches == 0 else 0))
-
-        # Add XP (10 XP per grape)
-        self._add_xp(10)
-
-    def _add_xp(self, amount: int):
-        """Add XP and handle level ups."""
-        profile = self.get_profile()
-        new_xp = profile['xp'] + amount
-        new_level = profile['level']
-
-        # Check for level up
-        while True:
-            required_xp = int(100 * (1.5 ** (new_level - 1)))
-            if new_xp >= required_xp:
-                new_xp -= required_xp
-                new_level += 1
-            else:
-                break
+        return (new_grapes, new_bunches, new_boxes, new_bottles, new_crates,
+                new_bunch_grapes, new_box_bunches, new_bottle_boxes, new_crate_bottles)
 
-        self.cursor.execute("""
-            UPDATE user_profile SET xp = ?, level = ? WHERE id = 1
-        """, (new_xp, new_level))
+    def _next_level_state(self, xp: int, level: int, amount: int) -> Tuple[int, int]:
+        """Compute (xp, level) after adding XP, handling level ups."""
+        # Find the level from total XP earned instead of stepping level by level
+        total = _LEVEL_CUM[level - 1] + xp + amount
+        new_level = bisect_right(_LEVEL_CUM, total)
+        new_xp = total - _LEVEL_CUM[new_level - 1]
 
-    def _update_streak(self):
-        """Update streak days."""
-        profile = self.get_profile()
-        today = date.today()
-        last_focus = profile['last_focus_date']
+        return new_xp, new_level
 
+    def _next_streak_state(self, streak_days: int, last_focus: Optional[int],
+                           today: date) -> int:
+        """Compute streak days for a focus session completed today."""
         if last_focus is None:
             # First time
-            new_streak = 1
+            return 1
+
+        days_diff = _epoch_day(today) - last_focus
+
+        if days_diff == 0:
+            # Same day, keep streak
+            return streak_days
+        if days_diff == 1:
+            # Consecutive day
+            return streak_days + 1
+        # Streak broken
+        return 1
+
+    def _session_info(self, session_id: int) -> Tuple[Optional[int], int]:
+        """Get a session's task ID and planned duration in minutes."""
+        self.cursor.execute(_SQL_SESSION_INFO, (session_id,))
+        row = self.cursor.fetchone()
+        return (row[0], row[1] or 0) if row else (None, 0)
+
+    def _upsert_task_minutes(self, day: date, task_id: Optional[int], minutes: int):
+        """Add focus minutes to a task's total for the given day."""
+        if task_id is None:
+            return
+        self.cursor.execute(_SQL_UPSERT_TASK_MINUTES, (_epoch_day(day), task_id, minutes))
+
+    def _upsert_grape_stats(self, day: date, grapes: Optional[Tuple[int, ...]] = None,
+                            focus_minutes: int = 0):
+        """
+        Add to the daily stats for the given day.
+
+        Args:
+            day: Day to record stats for
+            grapes: New progression state from _next_grape_state when a grape
+                was earned, or None when only focus time is recorded
+            focus_minutes: Focus minutes to add to the day's total
+        """
+        if grapes is None:
+            earned = bunches = boxes = 0
         else:
-            last_focus_date = date.fromisoformat(last_focus) if isinstance(last_focus, str) else last_focus
-            days_diff = (today - last_focus_date).days
-
-            if days_diff == 0:
-                # Same day, keep streak
-                new_streak = profile['streak_days']
-            elif days_diff == 1:
-                # Consecutive day
-                new_streak = profile['streak_days'] + 1
-            else:
-                # Streak broken
-                new_streak = 1
+            new_bunch_grapes, new_box_bunches = grapes[5], grapes[6]
+            earned = 1
+            bunches = 1 if new_bunch_grapes == 0 else 0
+            boxes = 1 if new_box_bunches == 0 else 0
 
-        self.cursor.execute("""
-            UPDATE user_profile SET streak_days = ?, last_focus_date = ? WHERE id = 1
-        """, (new_streak, today.isoformat()))
+        self.cursor.execute(_SQL_UPSERT_GRAPE_STATS,
+                            (_epoch_day(day), earned, bunches, boxes, focus_minutes))
 
     # ========== Profile & Stats ==========
 
-    def get_profile(self) -> Dict:
+    def get_profile(self) -> sqlite3.Row:
         """Get user profile."""
-        self.cursor.execute("SELECT * FROM user_profile WHERE id = 1")
-        return dict(self.cursor.fetchone())
+        with self._read_conn() as conn:
+            return conn.execute(_SQL_GET_PROFILE).fetchone()
 
     def get_xp_for_next_level(self, level: int) -> int:
         """Calculate XP required for next level."""
-        return int(100 * (1.5 ** (level - 1)))
+        return _LEVEL_REQ[level - 1]
 
     def get_language(self) -> str:
         """Get user's language preference."""
-        self.cursor.execute("SELECT language FROM user_profile WHERE id = 1")
-        result = self.cursor.fetchone()
+        with self._read_conn() as conn:
+            result = conn.execute("SELECT language FROM user_profile WHERE id = 1").fetchone()
         return result['language'] if result and result['language'] else 'ko'
 
     def set_language(self, language_code: str):
         """Set user's language preference."""
-        self.cursor.execute("""
-            UPDATE user_profile SET language = ? WHERE id = 1
-        """, (language_code,))
-        self.conn.commit()
+        with self._write_lock:
+            self.cursor.execute("""
+                UPDATE user_profile SET language = ? WHERE id = 1
+            """, (language_code,))
+            self.version += 1
 
-    def get_today_stats(self) -> Dict:
+    def get_today_stats(self) -> sqlite3.Row:
         """Get today's statistics."""
-        today = date.today().isoformat()
-
-        # Get today's grape stats
-        self.cursor.execute("""
-            SELECT * FROM grape_stats WHERE date = ?
-        """, (today,))
-        row = self.cursor.fetchone()
-
-        if row:
-            stats = dict(row)
-        else:
-            stats = {'grapes_earned': 0, 'bunches_completed': 0, 'boxes_completed': 0}
-
-        # Get completed sessions count
-        sessions = self.get_today_sessions()
-        stats['sessions_completed'] = len(sessions)
-
-        return stats
+        day_start, day_end = self._today_bounds()
+
+        # Grape stats and completed session count in one round-trip
+        with self._read_conn() as conn:
+            return conn.execute("""
+                WITH s AS (
+                    SELECT COUNT(*) AS c FROM focus_sessions
+                    WHERE completed = 1 AND started_at >= ? AND started_at < ?
+                )
+                SELECT COALESCE(g.grapes_earned, 0) AS grapes_earned,
+                       COALESCE(g.bunches_completed, 0) AS bunches_completed,
+                       COALESCE(g.boxes_completed, 0) AS boxes_completed,
+                       s.c AS sessions_completed
+                FROM s
+                LEFT JOIN grape_stats g ON g.date = ?
+            """, (day_start, day_end, _epoch_day(date.today()))).fetchone()
 
     def get_weekly_stats(self) -> List[Tuple[str, int]]:
         """Get weekly focus time statistics (last 7 days)."""
-        self.cursor.execute("""
-            SELECT DATE(started_at) as day,
-                   SUM(duration_minutes) as total_minutes
-            FROM focus_sessions
-            WHERE completed = 1
-              AND started_at >= date('now', '-7 days')
-            GROUP BY DATE(started_at)
-            ORDER BY day
-        """)
-
-        return [(row[0], row[1] or 0) for row in self.cursor.fetchall()]
+        # Read the per-day rollup maintained on write instead of scanning sessions
+        since = _epoch_day(date.today()) - 7
+        with self._read_conn() as conn:
+            rows = conn.execute("""
+                SELECT date, focus_minutes
+                FROM grape_stats
+                WHERE date >= ? AND focus_minutes > 0
+                ORDER BY date
+            """, (since,)).fetchall()
+
+        return [(_from_epoch_day(row[0]).isoformat(), row[1] or 0) for row in rows]
 
     def get_task_distribution(self) -> List[Tuple[str, int]]:
         """Get today's task time distribution."""
-        today = date.today().isoformat()
-
-        self.cursor.execute("""
-            SELECT t.title, SUM(fs.duration_minutes) as total_minutes
-            FROM focus_sessions fs
-            JOIN tasks t ON fs.task_id = t.id
-            WHERE DATE(fs.started_at) = ? AND fs.completed = 1
-            GROUP BY t.id, t.title
-            ORDER BY total_minutes DESC
-        """, (today,))
-
-        return [(row[0], row[1] or 0) for row in self.cursor.fetchall()]
+        # Read the per-day rollup maintained on session completion
+        with self._read_conn() as conn:
+            rows = conn.execute("""
+                SELECT t.title, m.minutes
+                FROM task_daily_minutes m
+                JOIN tasks t ON t.id = m.task_id
+                WHERE m.date = ?
+                ORDER BY m.minutes DESC
+            """, (_epoch_day(date.today()),)).fetchall()
+
+        return [(row[0], row[1] or 0) for row in rows]
 
     # ========== Badge Management ==========
 
-    def get_all_badges(self) -> List[Dict]:
+    def get_all_badges(self) -> List[sqlite3.Row]:
         """Get all badge definitions with earned status."""
-        self.cursor.execute("""
-            SELECT bd.*,
-                   CASE WHEN ub.id IS NOT NULL THEN 1 ELSE 0 END as earned,
-                   ub.earned_at
-            FROM badge_definitions bd
-            LEFT JOIN user_badges ub ON bd.id = ub.badge_id
-            ORDER BY bd.category, bd.id
-        """)
-
-        return [dict(row) for row in self.cursor.fetchall()]
-
-    def check_and_award_badges(self) -> List[Dict]:
+        with self._read_conn() as conn:
+            return conn.execute("""
+                SELECT bd.*,
+                       CASE WHEN ub.id IS NOT NULL THEN 1 ELSE 0 END as earned,
+                       ub.earned_at
+                FROM badge_definitions bd
+                LEFT JOIN user_badges ub ON bd.id = ub.badge_id
+                ORDER BY bd.category, bd.id
+            """).fetchall()
+
+    def check_and_award_badges(self) -> List[sqlite3.Row]:
         """Check all badge conditions and award new badges."""
-        profile = self.get_profile()
-        today_stats = self.get_today_stats()
-        new_badges = []
-
-        # Get all badges
-        all_badges = self.get_all_badges()
-
-        for badge in all_badges:
-            if badge['earned']:
-                continue  # Already earned
-
-            earned = False
-            condition_type = badge['condition_type']
-            condition_value = badge['condition_value']
-
-            # Check conditions
-            if condition_type == 'grapes':
-                earned = profile['total_grapes'] >= condition_value
-            elif condition_type == 'bunches':
-                earned = profile['total_bunches'] >= condition_value
-            elif condition_type == 'boxes':
-                earned = profile['total_boxes'] >= condition_value
-            elif condition_type == 'streak':
-                earned = profile['streak_days'] >= condition_value
-            elif condition_type == 'daily_grapes':
-                earned = today_stats['grapes_earned'] >= condition_value
-            elif condition_type == 'level':
-                earned = profile['level'] >= condition_value
-            elif condition_type == 'tasks_completed':
-                self.cursor.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1")
-                count = self.cursor.fetchone()[0]
-                earned = count >= condition_value
-            elif condition_type == 'total_hours':
-                total_hours = profile.get('total_focus_minutes', 0) / 60
-                earned = total_hours >= condition_value
-
-            if earned:
-                self.cursor.execute("""
-                    INSERT INTO user_badges (badge_id) VALUES (?)
-                """, (badge['id'],))
-                new_badges.append(badge)
+        with self._write_lock:
+            profile = self.get_profile()
+            today_stats = self.get_today_stats()
 
-        if new_badges:
-            self.conn.commit()
+            self.cursor.execute("SELECT COUNT(*) FROM tasks WHERE completed = 1")
+            tasks_completed = self.cursor.fetchone()[0]
 
-        return new_badges
+            self.cursor.execute("SELECT COALESCE(MAX(id), 0) FROM user_badges")
+            last_award_id = self.cursor.fetchone()[0]
+
+            # Evaluate every unearned badge's condition and award it in one statement
+            self.cursor.execute("""
+                INSERT INTO user_badges (badge_id)
+                SELECT bd.id
+                FROM badge_definitions bd
+                LEFT JOIN user_badges ub ON bd.id = ub.badge_id
+                WHERE ub.id IS NULL
+                  AND CASE bd.condition_type
+                        WHEN 'grapes' THEN :grapes >= bd.condition_value
+                        WHEN 'bunches' THEN :bunches >= bd.condition_value
+                        WHEN 'boxes' THEN :boxes >= bd.condition_value
+                        WHEN 'streak' THEN :streak >= bd.condition_value
+                        WHEN 'daily_grapes' THEN :daily_grapes >= bd.condition_value
+                        WHEN 'level' THEN :level >= bd.condition_value
+                        WHEN 'tasks_completed' THEN :tasks_completed >= bd.condition_value
+                        WHEN 'total_hours' THEN :total_hours >= bd.condition_value
+                        ELSE 0
+                      END
+                ORDER BY bd.category, bd.id
+            """, {
+                'grapes': profile['total_grapes'],
+                'bunches': profile['total_bunches'],
+                'boxes': profile['total_boxes'],
+                'streak': profile['streak_days'],
+                'daily_grapes': today_stats['grapes_earned'],
+                'level': profile['level'],
+                'tasks_completed': tasks_completed,
+                'total_hours': profile['total_focus_minutes'] / 60,
+            })
+
+            if self.cursor.rowcount <= 0:
+                return []
+            self.version += 1
+
+            self.cursor.execute("""
+                SELECT bd.*, 1 as earned, ub.earned_at
+                FROM user_badges ub
+                JOIN badge_definitions bd ON bd.id = ub.badge_id
+                WHERE ub.id > ?
+                ORDER BY bd.category, bd.id
+            """, (last_award_id,))
+
+            return self.cursor.fetchall()
+
+    def submit_session_completion(self, session_id: int,
+                                  collect_grape: bool = True) -> Future:
+        """
+        Complete a session and check badges on a background thread.
+
+        Keeps the commit off the GUI thread. The future's callbacks run on
+        the worker thread, so GUI code must hand results back to the main
+        thread (e.g. via a signal) before touching widgets.
+
+        Args:
+            session_id: Session ID to complete
+            collect_grape: Whether to collect grape (False for sessions < 15 minutes)
+
+        Returns:
+            Future resolving to (updated profile row or None, newly earned badges)
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ppodo-db")
+        return self._executor.submit(self._complete_session_and_award, session_id, collect_grape)
+
+    def _complete_session_and_award(self, session_id: int,
+                                    collect_grape: bool) -> Tuple[Optional[sqlite3.Row], List[sqlite3.Row]]:
+        """Worker body for submit_session_completion."""
+        profile = self.complete_session(session_id, collect_grape)
+        # Badges are only checked when a grape was collected, as before
+        new_badges = self.check_and_award_badges() if collect_grape else []
+        return profile, new_badges
 
     def close(self):
         """Close database connection."""
+        # Let queued background writes finish before closing the writer
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        # Cheap: only re-analyzes tables whose statistics have gone stale
+        self.conn.execute("PRAGMA optimize")
+        if self._read_pool is not None:
+            while not self._read_pool.empty():
+                self._read_pool.get_nowait().close()
         self.conn.close()
+
+
+class Snapshot:
+    """Profile and today's stats read once per UI refresh cycle.
+
+    Views that show the same rows share one snapshot instead of each
+    querying the database; rows are fetched on first access. Safe to read
+    from several threads: each row is fetched once.
+    """
+
+    def __init__(self, db: Database):
+        """
+        Initialize an empty snapshot.
+
+        Args:
+            db: Database to read from
+        """
+        self.db = db
+        self._profile: Optional[sqlite3.Row] = None
+        self._today_stats: Optional[sqlite3.Row] = None
+        self._lock = threading.Lock()
+
+    @property
+    def profile(self) -> sqlite3.Row:
+        """User profile, read on first access."""
+        with self._lock:
+            if self._profile is None:
+                self._profile = self.db.get_profile()
+            return self._profile
+
+    @property
+    def today_stats(self) -> sqlite3.Row:
+        """Today's statistics, read on first access."""
+        with self._lock:
+            if self._today_stats is None:
+                self._today_stats = self.db.get_today_stats()
+            return self._today_stats
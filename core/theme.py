@@ -2,13 +2,189 @@
 Theme system for Ppodo application.
 Provides 5 premium color themes for focus and break modes.
 """
-from typing import Dict, List
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Tuple
 from dataclasses import dataclass
 
+# Base stylesheet with theme color, parsed once at import
+_STYLESHEET_TEMPLATE = Template("""
+            QWidget {
+                background-color: #FFFFFF;
+                color: #2B2D42;
+                font-family: 'Segoe UI', Arial, sans-serif;
+            }
+
+            QPushButton {
+                background-color: $color;
+                color: #FFFFFF;
+                border: none;
+                border-radius: 8px;
+                padding: 12px 24px;
+                font-size: 14px;
+                font-weight: bold;
+            }
+
+            QPushButton:hover {
+                background-color: $dark;
+            }
+
+            QPushButton:pressed {
+                background-color: $dark_pressed;
+            }
+
+            QPushButton:disabled {
+                background-color: #CCCCCC;
+                color: #999999;
+            }
+
+            QProgressBar {
+                border: 2px solid $color;
+                border-radius: 5px;
+                text-align: center;
+                background-color: #F5F5F5;
+            }
+
+            QProgressBar::chunk {
+                background-color: $color;
+                border-radius: 3px;
+            }
+
+            QLineEdit {
+                border: 2px solid #E0E0E0;
+                border-radius: 5px;
+                padding: 8px;
+                font-size: 13px;
+                background-color: #FFFFFF;
+            }
+
+            QLineEdit:focus {
+                border: 2px solid $color;
+            }
+
+            QListWidget {
+                border: 1px solid #E0E0E0;
+                border-radius: 5px;
+                background-color: #FFFFFF;
+            }
+
+            QListWidget::item {
+                padding: 8px;
+                border-bottom: 1px solid #F0F0F0;
+            }
+
+            QListWidget::item:selected {
+                background-color: $color;
+                color: #FFFFFF;
+            }
+
+            QListWidget::item:hover {
+                background-color: $light;
+            }
+
+            QLabel {
+                color: #2B2D42;
+            }
+
+            QTabWidget::pane {
+                border: 1px solid #E0E0E0;
+                border-radius: 5px;
+            }
+
+            QTabBar::tab {
+                background-color: #F5F5F5;
+                color: #666666;
+                padding: 10px 20px;
+                margin-right: 2px;
+                border-top-left-radius: 5px;
+                border-top-right-radius: 5px;
+            }
+
+            QTabBar::tab:selected {
+                background-color: $color;
+                color: #FFFFFF;
+            }
+
+            QTabBar::tab:hover {
+                background-color: $light;
+            }
+        """)
+
+
+# Pure hex -> hex transforms over a handful of inputs, so memoize them
+@lru_cache(maxsize=None)
+def _darken_color(hex_color: str, factor: float = 0.2) -> str:
+    """
+    Darken a hex color.
+
+    Args:
+        hex_color: Hex color string (e.g., '#E63946')
+        factor: Darkening factor (0-1)
+
+    Returns:
+        Darkened hex color
+    """
+    v = int(hex_color[1:], 16) if hex_color.startswith('#') else int(hex_color, 16)
+    r, g, b = (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+
+    inv = 1 - factor
+    r = int(r * inv)
+    g = int(g * inv)
+    b = int(b * inv)
+
+    return f'#{(r << 16) | (g << 8) | b:06x}'
+
+
+def _lighten_rgb(rgb: int, factor: float) -> int:
+    """
+    Lighten a packed 0xRRGGBB color with integer channel math.
+
+    Args:
+        rgb: Color packed as 0xRRGGBB
+        factor: Lightening factor (0-1)
+
+    Returns:
+        Lightened color packed as 0xRRGGBB
+    """
+    r, g, b = (rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF
+
+    r = int(r + (255 - r) * factor)
+    g = int(g + (255 - g) * factor)
+    b = int(b + (255 - b) * factor)
+
+    return (r << 16) | (g << 8) | b
+
+
+@lru_cache(maxsize=None)
+def _lighten_color(hex_color: str, factor: float = 0.8) -> str:
+    """
+    Lighten a hex color.
+
+    Thin adapter over _lighten_rgb; callers producing many shades of one
+    color should parse it once and call _lighten_rgb directly.
 
-@dataclass
+    Args:
+        hex_color: Hex color string (e.g., '#E63946')
+        factor: Lightening factor (0-1)
+
+    Returns:
+        Lightened hex color
+    """
+    v = int(hex_color[1:], 16) if hex_color.startswith('#') else int(hex_color, 16)
+    return f'#{_lighten_rgb(v, factor):06x}'
+
+
+@dataclass(frozen=True)
 class Theme:
     """Theme data class."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10). The last six
+    # hold the hover/pressed/highlight shades of the focus and break colors,
+    # derived in __post_init__ rather than passed in.
+    __slots__ = ('name', 'focus_color', 'break_color', 'pause_color', 'pause_hover',
+                 'concept', 'focus_dark', 'focus_dark_pressed', 'focus_light',
+                 'break_dark', 'break_dark_pressed', 'break_light')
+
     name: str
     focus_color: str
     break_color: str
@@ -16,66 +192,91 @@ class Theme:
     pause_hover: str
     concept: str
 
+    def __post_init__(self):
+        """Derive the shades once; frozen, so set through object.__setattr__."""
+        shades = {
+            'focus_dark': _darken_color(self.focus_color),
+            'focus_dark_pressed': _darken_color(self.focus_color, 0.3),
+            'focus_light': _lighten_color(self.focus_color),
+            'break_dark': _darken_color(self.break_color),
+            'break_dark_pressed': _darken_color(self.break_color, 0.3),
+            'break_light': _lighten_color(self.break_color),
+        }
+        for name, value in shades.items():
+            object.__setattr__(self, name, value)
+
+
+# Premium theme palette (5 themes)
+_THEMES = MappingProxyType({
+    # 1. Nordic (기존 Classic 대체): 차분하고 지적인 북유럽 스타일의 블루톤
+    "Nordic": Theme(
+        name="Nordic",
+        focus_color="#457B9D",  # Steel Blue (차분한 집중)
+        break_color="#A8DADC",  # Pale Blue (시원한 휴식)
+        pause_color="#E9C46A",  # Sand Yellow (따뜻한 주의 환기)
+        pause_hover="#D4A373",  # Muted Bronze
+        concept="북유럽의 차분함과 지적인 분위기"
+    ),
+
+    # 2. Midnight: 깊은 밤의 몰입감 (다크 모드 선호 시 최적)
+    "Midnight": Theme(
+        name="Midnight",
+        focus_color="#2B2D42",  # Dark Slate (깊은 몰입)
+        break_color="#8D99AE",  # Cool Grey (눈이 편한 회색)
+        pause_color="#FFD166",  # Sunglow (어두운 배경 위 확실한 강조)
+        pause_hover="#FFC035",  # Deep Yellow
+        concept="깊은 밤의 고요함과 완벽한 몰입"
+    ),
+
+    # 3. Forest: 자연의 편안함 (가장 눈이 편한 조합)
+    "Forest": Theme(
+        name="Forest",
+        focus_color="#2D6A4F",  # Deep Green (숲의 깊이)
+        break_color="#D8E2DC",  # Mist Green (안개 낀 숲)
+        pause_color="#D4A373",  # Wood Brown (나무 색상으로 자연스러운 조화)
+        pause_hover="#BC6C25",  # Caramel
+        concept="숲속의 피톤치드와 같은 안정감"
+    ),
+
+    # 4. Lavender (기존 Royal 대체): 창의적이고 몽환적인 보라빛
+    "Lavender": Theme(
+        name="Lavender",
+        focus_color="#7209B7",  # Vivid Violet (창의성 자극)
+        break_color="#E0AAFF",  # Soft Lilac (부드러운 이완)
+        pause_color="#4CC9F0",  # Vivid Sky Blue (보라색과 보색에 가까운 팝한 느낌)
+        pause_hover="#4895EF",  # Dodger Blue
+        concept="영감을 깨우는 감각적인 바이올렛"
+    ),
+
+    # 5. Cafe (기존 Sunset 대체): 따뜻하고 아늑한 커피 색상
+    "Cafe": Theme(
+        name="Cafe",
+        focus_color="#6F4E37",  # Coffee Bean (따뜻한 브라운)
+        break_color="#F5E0B7",  # Latte Foam (부드러운 베이지)
+        pause_color="#E67E22",  # Carrot Orange (커피와 어울리는 따뜻한 포인트)
+        pause_hover="#D35400",  # Pumpkin
+        concept="카페에서의 여유롭고 따뜻한 집중"
+    )
+})
+
 
 class ThemeManager:
     """Manages application themes."""
 
-    # Premium theme palette (5 themes)
-    THEMES = {
-        # 1. Nordic (기존 Classic 대체): 차분하고 지적인 북유럽 스타일의 블루톤
-        "Nordic": Theme(
-            name="Nordic",
-            focus_color="#457B9D",  # Steel Blue (차분한 집중)
-            break_color="#A8DADC",  # Pale Blue (시원한 휴식)
-            pause_color="#E9C46A",  # Sand Yellow (따뜻한 주의 환기)
-            pause_hover="#D4A373",  # Muted Bronze
-            concept="북유럽의 차분함과 지적인 분위기"
-        ),
-
-        # 2. Midnight: 깊은 밤의 몰입감 (다크 모드 선호 시 최적)
-        "Midnight": Theme(
-            name="Midnight",
-            focus_color="#2B2D42",  # Dark Slate (깊은 몰입)
-            break_color="#8D99AE",  # Cool Grey (눈이 편한 회색)
-            pause_color="#FFD166",  # Sunglow (어두운 배경 위 확실한 강조)
-            pause_hover="#FFC035",  # Deep Yellow
-            concept="깊은 밤의 고요함과 완벽한 몰입"
-        ),
-
-        # 3. Forest: 자연의 편안함 (가장 눈이 편한 조합)
-        "Forest": Theme(
-            name="Forest",
-            focus_color="#2D6A4F",  # Deep Green (숲의 깊이)
-            break_color="#D8E2DC",  # Mist Green (안개 낀 숲)
-            pause_color="#D4A373",  # Wood Brown (나무 색상으로 자연스러운 조화)
-            pause_hover="#BC6C25",  # Caramel
-            concept="숲속의 피톤치드와 같은 안정감"
-        ),
-
-        # 4. Lavender (기존 Royal 대체): 창의적이고 몽환적인 보라빛
-        "Lavender": Theme(
-            name="Lavender",
-            focus_color="#7209B7",  # Vivid Violet (창의성 자극)
-            break_color="#E0AAFF",  # Soft Lilac (부드러운 이완)
-            pause_color="#4CC9F0",  # Vivid Sky Blue (보라색과 보색에 가까운 팝한 느낌)
-            pause_hover="#4895EF",  # Dodger Blue
-            concept="영감을 깨우는 감각적인 바이올렛"
-        ),
-
-        # 5. Cafe (기존 Sunset 대체): 따뜻하고 아늑한 커피 색상
-        "Cafe": Theme(
-            name="Cafe",
-            focus_color="#6F4E37",  # Coffee Bean (따뜻한 브라운)
-            break_color="#F5E0B7",  # Latte Foam (부드러운 베이지)
-            pause_color="#E67E22",  # Carrot Orange (커피와 어울리는 따뜻한 포인트)
-            pause_hover="#D35400",  # Pumpkin
-            concept="카페에서의 여유롭고 따뜻한 집중"
-        )
-    }
+    # Read-only alias of the module-level palette
+    THEMES = _THEMES
+
+    # The palette never changes at runtime, so the getters share these
+    _ALL_THEMES: Tuple[Theme, ...] = tuple(_THEMES.values())
+    _THEME_NAMES: Tuple[str, ...] = tuple(_THEMES.keys())
 
     def __init__(self):
         """Initialize theme manager with Nordic theme."""
         self.current_theme_name = "Nordic"
+        # Current Theme object, updated together with current_theme_name
+        self._current_theme = _THEMES["Nordic"]
+        # Generated stylesheets keyed by (theme name, is_focus)
+        self._stylesheet_cache: Dict[Tuple[str, bool], str] = {}
 
     def get_theme(self, name: str = None) -> Theme:
         """
@@ -88,9 +289,9 @@ class ThemeManager:
             Theme object
         """
         if name is None:
-            name = self.current_theme_name
+            return self._current_theme
 
-        return self.THEMES.get(name, self.THEMES["Nordic"])
+        return _THEMES.get(name) or _THEMES["Nordic"]
 
     def set_theme(self, name: str):
         """
@@ -99,26 +300,28 @@ class ThemeManager:
         Args:
             name: Theme name
         """
-        if name in self.THEMES:
+        theme = _THEMES.get(name)
+        if theme is not None:
             self.current_theme_name = name
+            self._current_theme = theme
 
-    def get_all_themes(self) -> List[Theme]:
+    def get_all_themes(self) -> Tuple[Theme, ...]:
         """
         Get all available themes.
 
         Returns:
-            List of Theme objects
+            Tuple of Theme objects
         """
-        return list(self.THEMES.values())
+        return self._ALL_THEMES
 
-    def get_theme_names(self) -> List[str]:
+    def get_theme_names(self) -> Tuple[str, ...]:
         """
         Get all theme names.
 
         Returns:
-            List of theme names
+            Tuple of theme names
         """
-        return list(self.THEMES.keys())
+        return self._THEME_NAMES
 
     def get_focus_color(self, theme_name: str = None) -> str:
         """
@@ -130,7 +333,7 @@ class ThemeManager:
         Returns:
             Hex color string
         """
-        theme = self.get_theme(theme_name)
+        theme = self._current_theme if theme_name is None else self.get_theme(theme_name)
         return theme.focus_color
 
     def get_break_color(self, theme_name: str = None) -> str:
@@ -143,7 +346,7 @@ class ThemeManager:
         Returns:
             Hex color string
         """
-        theme = self.get_theme(theme_name)
+        theme = self._current_theme if theme_name is None else self.get_theme(theme_name)
         return theme.break_color
 
     def get_pause_color(self, theme_name: str = None) -> str:
@@ -156,7 +359,7 @@ class ThemeManager:
         Returns:
             Hex color string
         """
-        theme = self.get_theme(theme_name)
+        theme = self._current_theme if theme_name is None else self.get_theme(theme_name)
         return theme.pause_color
 
     def get_pause_hover_color(self, theme_name: str = None) -> str:
@@ -169,7 +372,7 @@ class ThemeManager:
         Returns:
             Hex color string
         """
-        theme = self.get_theme(theme_name)
+        theme = self._current_theme if theme_name is None else self.get_theme(theme_name)
         return theme.pause_hover
 
     def get_current_color(self, is_focus: bool) -> str:
@@ -182,130 +385,48 @@ class ThemeManager:
         Returns:
             Hex color string
         """
-        theme = self.get_theme()
+        theme = self._current_theme
         return theme.focus_color if is_focus else theme.break_color
 
-    def apply_stylesheet(self, widget, is_focus: bool = True) -> str:
+    def build_app_stylesheet(self, is_focus: bool = True) -> str:
         """
-        Generate Qt stylesheet for a widget.
+        Generate the base Qt stylesheet for the main window.
+
+        Apply it once at the top-level window and let child widgets inherit
+        it, rather than setting it on individual widgets.
 
         Args:
-            widget: Widget class name or identifier
             is_focus: True for focus mode, False for break mode
 
         Returns:
             Qt stylesheet string
         """
-        color = self.get_current_color(is_focus)
-
-        # Base stylesheet with theme color
-        stylesheet = f"""
-            QWidget {{
-                background-color: #FFFFFF;
-                color: #2B2D42;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }}
-
-            QPushButton {{
-                background-color: {color};
-                color: #FFFFFF;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-
-            QPushButton:hover {{
-                background-color: {self._darken_color(color)};
-            }}
-
-            QPushButton:pressed {{
-                background-color: {self._darken_color(color, 0.3)};
-            }}
-
-            QPushButton:disabled {{
-                background-color: #CCCCCC;
-                color: #999999;
-            }}
-
-            QProgressBar {{
-                border: 2px solid {color};
-                border-radius: 5px;
-                text-align: center;
-                background-color: #F5F5F5;
-            }}
-
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 3px;
-            }}
-
-            QLineEdit {{
-                border: 2px solid #E0E0E0;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-                background-color: #FFFFFF;
-            }}
-
-            QLineEdit:focus {{
-                border: 2px solid {color};
-            }}
-
-            QListWidget {{
-                border: 1px solid #E0E0E0;
-                border-radius: 5px;
-                background-color: #FFFFFF;
-            }}
-
-            QListWidget::item {{
-                padding: 8px;
-                border-bottom: 1px solid #F0F0F0;
-            }}
-
-            QListWidget::item:selected {{
-                background-color: {color};
-                color: #FFFFFF;
-            }}
-
-            QListWidget::item:hover {{
-                background-color: {self._lighten_color(color)};
-            }}
-
-            QLabel {{
-                color: #2B2D42;
-            }}
-
-            QTabWidget::pane {{
-                border: 1px solid #E0E0E0;
-                border-radius: 5px;
-            }}
-
-            QTabBar::tab {{
-                background-color: #F5F5F5;
-                color: #666666;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }}
-
-            QTabBar::tab:selected {{
-                background-color: {color};
-                color: #FFFFFF;
-            }}
-
-            QTabBar::tab:hover {{
-                background-color: {self._lighten_color(color)};
-            }}
-        """
-
+        key = (self.current_theme_name, is_focus)
+        stylesheet = self._stylesheet_cache.get(key)
+        if stylesheet is not None:
+            return stylesheet
+
+        theme = self._current_theme
+        if is_focus:
+            color, dark, dark_pressed, light = (
+                theme.focus_color, theme.focus_dark, theme.focus_dark_pressed, theme.focus_light)
+        else:
+            color, dark, dark_pressed, light = (
+                theme.break_color, theme.break_dark, theme.break_dark_pressed, theme.break_light)
+
+        stylesheet = _STYLESHEET_TEMPLATE.substitute(
+            color=color, dark=dark, dark_pressed=dark_pressed, light=light)
+
+        self._stylesheet_cache[key] = stylesheet
         return stylesheet
 
-    def _darken_color(self, hex_color: str, factor: float = 0.2) -> str:
+    # Color helpers are module functions so Theme can use them too
+    _darken_color = staticmethod(_darken_color)
+    _lighten_color = staticmethod(_lighten_color)
+
+    def darken_color(self, hex_color: str, factor: float = 0.2) -> str:
         """
-        Darken a hex color.
+        Darken a hex color (memoized).
 
         Args:
             hex_color: Hex color string (e.g., '#E63946')
@@ -314,18 +435,11 @@ class ThemeManager:
         Returns:
             Darkened hex color
         """
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+        return _darken_color(hex_color, factor)
 
-        r = int(r * (1 - factor))
-        g = int(g * (1 - factor))
-        b = int(b * (1 - factor))
-
-        return f'#{r:02x}{g:02x}{b:02x}'
-
-    def _lighten_color(self, hex_color: str, factor: float = 0.8) -> str:
+    def lighten_color(self, hex_color: str, factor: float = 0.8) -> str:
         """
-        Lighten a hex color.
+        Lighten a hex color (memoized).
 
         Args:
             hex_color: Hex color string (e.g., '#E63946')
@@ -334,11 +448,4 @@ class ThemeManager:
         Returns:
             Lightened hex color
         """
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-
-        r = int(r + (255 - r) * factor)
-        g = int(g + (255 - g) * factor)
-        b = int(b + (255 - b) * factor)
-
-        return f'#{r:02x}{g:02x}{b:02x}'
+        return _lighten_color(hex_color, factor)
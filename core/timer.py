@@ -2,17 +2,30 @@
 Timer module for Ppodo application.
 Manages Pomodoro timer logic with focus and break cycles.
 """
-from enum import Enum
+import time
+from enum import IntEnum
 from typing import Callable, Optional
 from PySide6.QtCore import QTimer, QObject, Signal
 
 
-class TimerState(Enum):
-    """Timer state enumeration."""
-    IDLE = "idle"
-    FOCUS = "focus"
-    BREAK = "break"
-    PAUSED = "paused"
+class TimerState(IntEnum):
+    """Timer state enumeration (bit flags, so running states can be masked)."""
+    IDLE = 0
+    FOCUS = 1
+    BREAK = 2
+    PAUSED = 4
+
+
+# Any state in which the countdown is active
+_RUNNING_MASK = TimerState.FOCUS | TimerState.BREAK
+
+# State names emitted by state_changed
+_STATE_NAMES = {
+    TimerState.IDLE: "idle",
+    TimerState.FOCUS: "focus",
+    TimerState.BREAK: "break",
+    TimerState.PAUSED: "paused",
+}
 
 
 class PomodoroTimer(QObject):
@@ -40,6 +53,10 @@ class PomodoroTimer(QObject):
         self.state = TimerState.IDLE
         self.remaining_seconds = 0
         self.total_seconds = 0
+        # Countdown is measured against the monotonic clock, so late ticks
+        # don't make it drift: _end_time while running, _paused_left while paused
+        self._end_time = 0.0
+        self._paused_left = 0.0
 
         # Qt timer for countdown
         self.qt_timer = QTimer()
@@ -51,8 +68,10 @@ class PomodoroTimer(QObject):
         self.state = TimerState.FOCUS
         self.remaining_seconds = self.focus_duration
         self.total_seconds = self.focus_duration
+        self._end_time = time.monotonic() + self.remaining_seconds
+        self.qt_timer.setInterval(1000)
         self.qt_timer.start()
-        self.state_changed.emit(self.state.value)
+        self.state_changed.emit(_STATE_NAMES[self.state])
         self.tick.emit(self.remaining_seconds)
 
     def start_break(self):
@@ -60,16 +79,19 @@ class PomodoroTimer(QObject):
         self.state = TimerState.BREAK
         self.remaining_seconds = self.break_duration
         self.total_seconds = self.break_duration
+        self._end_time = time.monotonic() + self.remaining_seconds
+        self.qt_timer.setInterval(1000)
         self.qt_timer.start()
-        self.state_changed.emit(self.state.value)
+        self.state_changed.emit(_STATE_NAMES[self.state])
         self.tick.emit(self.remaining_seconds)
 
     def pause(self):
         """Pause the current session."""
-        if self.state in (TimerState.FOCUS, TimerState.BREAK):
+        if self.state & _RUNNING_MASK:
             self.qt_timer.stop()
+            self._paused_left = self._end_time - time.monotonic()
             self.state = TimerState.PAUSED
-            self.state_changed.emit(self.state.value)
+            self.state_changed.emit(_STATE_NAMES[self.state])
 
     def resume(self):
         """Resume from pause."""
@@ -80,8 +102,10 @@ class PomodoroTimer(QObject):
             else:
                 self.state = TimerState.BREAK
 
+            self._end_time = time.monotonic() + self._paused_left
+            self._schedule_next_tick()
             self.qt_timer.start()
-            self.state_changed.emit(self.state.value)
+            self.state_changed.emit(_STATE_NAMES[self.state])
 
     def stop(self):
         """Stop and reset the timer."""
@@ -89,12 +113,29 @@ class PomodoroTimer(QObject):
         self.state = TimerState.IDLE
         self.remaining_seconds = 0
         self.total_seconds = 0
-        self.state_changed.emit(self.state.value)
+        self.state_changed.emit(_STATE_NAMES[self.state])
         self.tick.emit(self.remaining_seconds)
 
+    def _schedule_next_tick(self):
+        """Aim the next tick at the next whole second of the countdown."""
+        ms = int((self._end_time - time.monotonic()) * 1000) % 1000
+        # A tick that fired slightly early is already on its second;
+        # skip to the following one instead of waking again right away
+        if ms < 50:
+            ms += 1000
+        self.qt_timer.setInterval(ms)
+
     def _on_tick(self):
         """Handle timer tick (called every second)."""
-        self.remaining_seconds -= 1
+        self._schedule_next_tick()
+
+        # Rounded so a tick arriving slightly early or late still lands on
+        # the intended second
+        remaining = max(0, round(self._end_time - time.monotonic()))
+        if remaining == self.remaining_seconds:
+            return
+
+        self.remaining_seconds = remaining
         self.tick.emit(self.remaining_seconds)
 
         if self.remaining_seconds <= 0:
@@ -111,7 +152,7 @@ class PomodoroTimer(QObject):
         elif self.state == TimerState.BREAK:
             self.break_completed.emit()
             self.state = TimerState.IDLE
-            self.state_changed.emit(self.state.value)
+            self.state_changed.emit(_STATE_NAMES[self.state])
 
     def get_remaining_time(self) -> tuple[int, int]:
         """
@@ -150,7 +191,11 @@ class PomodoroTimer(QObject):
 
     def is_running(self) -> bool:
         """Check if timer is currently running."""
-        return self.state in (TimerState.FOCUS, TimerState.BREAK)
+        return bool(self.state & _RUNNING_MASK)
+
+    def get_state_name(self) -> str:
+        """Get the current state's name, as emitted by state_changed."""
+        return _STATE_NAMES[self.state]
 
     def is_focus(self) -> bool:
         """Check if currently in focus mode."""
@@ -7,6 +7,12 @@ Version: 2.1
 """
 import sys
 import os
+
+# Qt reads these when the application starts; set them before any Qt import
+# and keep values the user already exported
+os.environ.setdefault("QT_AUTO_SCREEN_SCALE_FACTOR", "1")
+os.environ.setdefault("QT_SCALE_FACTOR", "1")
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from ui.main_window import MainWindow
@@ -14,17 +20,11 @@ from ui.main_window import MainWindow
 
 def main():
     """Main application entry point."""
-    # Set environment variable for better Qt scaling on Windows
-    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
-    os.environ["QT_SCALE_FACTOR"] = "1"
-
-    # Enable high DPI scaling for better resolution support
+    # High DPI scaling is always on in Qt 6; only the rounding policy is set.
     # Use Round policy for better compatibility at 1920x1080
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.Round
     )
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
     # Create application
     app = QApplication(sys.argv)
@@ -2,16 +2,117 @@
 Badge collection widget for Ppodo application.
 Displays all 15 badges with earned/unearned status.
 """
+from collections import defaultdict
+from typing import Dict, Tuple
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QScrollArea, QFrame, QGridLayout
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QScrollArea, QGridLayout
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QFont, QFontMetricsF, QPainter, QPen, QPixmap, QTextOption
 from core.database import Database
 
 
-class BadgeCard(QFrame):
-    """Individual badge card widget."""
+class BadgeRenderer:
+    """Paints badge cards into pixmaps, cached per badge and earned state."""
+
+    WIDTH = 140
+    HEIGHT = 180
+    _PADDING = 10
+    _SPACING = 5
+
+    # (border, background) of the card frame
+    _FRAME_COLORS = {True: ("#27AE60", "#FFFFFF"), False: ("#E0E0E0", "#FAFAFA")}
+    # (text, text color, background, bold) of the status strip
+    _STATUS = {
+        True: ("✓ 획득", "#FFFFFF", "#27AE60", True),
+        False: ("미획득", "#999999", "#F0F0F0", False),
+    }
+
+    _cache: Dict[Tuple[int, bool, float], QPixmap] = {}
+
+    @classmethod
+    def get(cls, badge, earned: bool, device_pixel_ratio: float = 1.0) -> QPixmap:
+        """
+        Get the rendered card for a badge.
+
+        Args:
+            badge: Badge row with id, icon, name and description
+            earned: Whether to draw the earned or unearned look
+            device_pixel_ratio: Screen scale factor to render at
+
+        Returns:
+            Card pixmap of WIDTH x HEIGHT logical pixels
+        """
+        key = (badge['id'], earned, device_pixel_ratio)
+        pixmap = cls._cache.get(key)
+        if pixmap is None:
+            pixmap = cls._cache[key] = cls._render(badge, earned, device_pixel_ratio)
+        return pixmap
+
+    @classmethod
+    def _render(cls, badge, earned: bool, device_pixel_ratio: float) -> QPixmap:
+        """Paint one card: frame, icon, name, description and status strip."""
+        pixmap = QPixmap(round(cls.WIDTH * device_pixel_ratio), round(cls.HEIGHT * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+
+        # Frame
+        border, background = cls._FRAME_COLORS[earned]
+        painter.setPen(QPen(QColor(border), 2))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(QRectF(1, 1, cls.WIDTH - 2, cls.HEIGHT - 2), 10, 10)
+
+        content = QRectF(cls._PADDING, cls._PADDING,
+                         cls.WIDTH - 2 * cls._PADDING, cls.HEIGHT - 2 * cls._PADDING)
+        wrap = QTextOption(Qt.AlignHCenter)
+        wrap.setWrapMode(QTextOption.WordWrap)
+
+        # Status strip pinned to the bottom
+        text, color, strip, bold = cls._STATUS[earned]
+        painter.setFont(cls._font(11, bold))
+        strip_height = painter.fontMetrics().height() + 8
+        strip_rect = QRectF(content.left(), content.bottom() - strip_height,
+                            content.width(), strip_height)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(strip))
+        painter.drawRoundedRect(strip_rect, 3, 3)
+        painter.setPen(QColor(color))
+        painter.drawText(strip_rect, Qt.AlignCenter, text)
+
+        # Icon, name and description stacked from the top
+        y = content.top()
+        for value, size, bold, color in (
+            (badge['icon'], 40, False, "#2B2D42"),
+            (badge['name'], 13, True, "#2B2D42"),
+            (badge['description'], 11, False, "#666666"),
+        ):
+            painter.setFont(cls._font(size, bold))
+            painter.setPen(QColor(color))
+            rect = QRectF(content.left(), y, content.width(), strip_rect.top() - cls._SPACING - y)
+            used = QFontMetricsF(painter.font()).boundingRect(rect, Qt.TextWordWrap, value)
+            painter.drawText(rect, value, wrap)
+            y += min(used.height(), rect.height()) + cls._SPACING
+
+        painter.end()
+        return pixmap
+
+    @staticmethod
+    def _font(pixel_size: int, bold: bool) -> QFont:
+        """Application font at the given pixel size."""
+        font = QFont(QApplication.font())
+        font.setPixelSize(pixel_size)
+        font.setBold(bold)
+        return font
+
+
+class BadgeCard(QLabel):
+    """Individual badge card widget, shown as a pre-rendered pixmap."""
 
     def __init__(self, badge: dict):
         """
@@ -22,77 +123,23 @@ class BadgeCard(QFrame):
         """
         super().__init__()
         self.badge = badge
-        self._init_ui()
+        self._earned = None
+        self.setFixedSize(BadgeRenderer.WIDTH, BadgeRenderer.HEIGHT)
+        self.set_earned(bool(self.badge['earned']))
 
-    def _init_ui(self):
-        """Initialize UI components."""
-        layout = QVBoxLayout()
-        layout.setSpacing(5)
-
-        # Badge icon
-        icon = QLabel(self.badge['icon'])
-        icon.setStyleSheet("font-size: 40px;")
-        icon.setAlignment(Qt.AlignCenter)
-        layout.addWidget(icon)
-
-        # Badge name
-        name = QLabel(self.badge['name'])
-        name.setStyleSheet("font-size: 13px; font-weight: bold;")
-        name.setAlignment(Qt.AlignCenter)
-        name.setWordWrap(True)
-        layout.addWidget(name)
-
-        # Badge description
-        desc = QLabel(self.badge['description'])
-        desc.setStyleSheet("font-size: 11px; color: #666;")
-        desc.setAlignment(Qt.AlignCenter)
-        desc.setWordWrap(True)
-        layout.addWidget(desc)
-
-        # Earned status
-        if self.badge['earned']:
-            status = QLabel("✓ 획득")
-            status.setStyleSheet("""
-                font-size: 11px;
-                font-weight: bold;
-                color: #FFFFFF;
-                background-color: #27AE60;
-                padding: 4px 8px;
-                border-radius: 3px;
-            """)
-            self.setStyleSheet("""
-                BadgeCard {
-                    border: 2px solid #27AE60;
-                    border-radius: 10px;
-                    background-color: #FFFFFF;
-                    padding: 10px;
-                }
-            """)
-        else:
-            status = QLabel("미획득")
-            status.setStyleSheet("""
-                font-size: 11px;
-                color: #999;
-                background-color: #F0F0F0;
-                padding: 4px 8px;
-                border-radius: 3px;
-            """)
-            self.setStyleSheet("""
-                BadgeCard {
-                    border: 2px solid #E0E0E0;
-                    border-radius: 10px;
-                    background-color: #FAFAFA;
-                    padding: 10px;
-                    opacity: 0.6;
-                }
-            """)
-
-        status.setAlignment(Qt.AlignCenter)
-        layout.addWidget(status)
-
-        self.setLayout(layout)
-        self.setFixedWidth(140)
-        self.setFixedHeight(180)
+    def set_earned(self, earned: bool):
+        """
+        Show the badge as earned or unearned.
+
+        Swaps in the cached pixmap for the state, only when it changes.
+
+        Args:
+            earned: Whether the badge has been earned
+        """
+        if earned == self._earned:
+            return
+        self._earned = earned
+        self.setPixmap(BadgeRenderer.get(self.badge, earned, self.devicePixelRatioF()))
 
 
 class BadgeWidget(QWidget):
@@ -107,6 +154,10 @@ class BadgeWidget(QWidget):
         """
         super().__init__()
         self.db = db
+        # Badge cards by badge id, created once and updated in place
+        self._cards = {}
+        # db.version of the last render; see refresh
+        self._rendered_version = None
         self._init_ui()
 
     def _init_ui(self):
@@ -141,6 +192,13 @@ class BadgeWidget(QWidget):
 
         layout.addStretch()
         container.setLayout(layout)
+        self._container = container
+
+        # Cards and count start from the same read; refresh skips until a write
+        self._rendered_version = self.db.version
+        badges = self.db.get_all_badges()
+        self._build_grid(badges)
+        self._update_stats(badges)
 
         scroll.setWidget(container)
 
@@ -150,24 +208,24 @@ class BadgeWidget(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
 
-    def refresh(self):
-        """Refresh badge collection display."""
+    def _build_grid(self, badges):
+        """
+        Create badge cards grouped by category.
+
+        Args:
+            badges: Badge rows from Database.get_all_badges
+        """
         # Clear existing badges
         while self.badge_grid.count():
             item = self.badge_grid.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self._cards.clear()
 
-        # Get all badges
-        badges = self.db.get_all_badges()
-
-        # Group by category
-        categories = {}
+        # Group by category; rows arrive ordered by (category, id)
+        categories = defaultdict(list)
         for badge in badges:
-            category = badge['category']
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(badge)
+            categories[badge['category']].append(badge)
 
         # Display badges by category
         row = 0
@@ -182,6 +240,7 @@ class BadgeWidget(QWidget):
             col = 0
             for badge in category_badges:
                 card = BadgeCard(badge)
+                self._cards[badge['id']] = card
                 self.badge_grid.addWidget(card, row, col)
                 col += 1
                 if col >= 3:  # 3 badges per row
@@ -191,7 +250,38 @@ class BadgeWidget(QWidget):
             if col > 0:
                 row += 1
 
-        # Update stats
+    def refresh(self):
+        """Refresh badge collection display."""
+        # Badges only change through database writes
+        version = self.db.version
+        if version == self._rendered_version:
+            return
+        self._rendered_version = version
+
+        # Get all badges
+        badges = self.db.get_all_badges()
+
+        # Suspend painting so all card changes land in one layout/repaint pass
+        self._container.setUpdatesEnabled(False)
+        try:
+            # Cards are reused; rebuild only if the set of badges changed
+            if len(badges) != len(self._cards) or any(b['id'] not in self._cards for b in badges):
+                self._build_grid(badges)
+            else:
+                for badge in badges:
+                    self._cards[badge['id']].set_earned(bool(badge['earned']))
+        finally:
+            self._container.setUpdatesEnabled(True)
+
+        self._update_stats(badges)
+
+    def _update_stats(self, badges):
+        """
+        Show how many of the badges are earned.
+
+        Args:
+            badges: Badge rows from Database.get_all_badges
+        """
         earned_count = sum(1 for b in badges if b['earned'])
         total_count = len(badges)
         self.stats_label.setText(f"{earned_count} / {total_count} 획득")
@@ -2,12 +2,36 @@
 Grape collection widget for Ppodo application.
 Displays grape → bunch → box → wine bottle → wine crate progression.
 """
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox, QGridLayout
+from collections import namedtuple
+from datetime import date
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGridLayout
 from PySide6.QtCore import Qt
-from core.database import Database
+from core.database import Database, Snapshot
+from ui.refresh_worker import RefreshMixin
+
+# (icon, name, total column, progress column) of each stage, in grid order
+_STAGES = (
+    ("🍇", "포도송이", "total_bunches", "current_bunch_grapes"),    # Grape Bunch
+    ("📦", "포도상자", "total_boxes", "current_box_bunches"),       # Grape Box
+    ("🍷", "와인병", "total_wine_bottles", "current_bottle_boxes"),  # Wine Bottle
+    ("🍾", "와인상자", "total_wine_crates", "current_crate_bottles"),  # Wine Crate
+)
+
+# Labels of one stage box, with the profile columns they show
+StageLabels = namedtuple('StageLabels', 'icon name total progress total_key progress_key')
+
+# Progress label text for every fill level of a 10-step stage
+_PROGRESS_TEXT = tuple(f"{i}/10" for i in range(11))
+
+
+def _progress_text(current: int) -> str:
+    """Get the "n/10" progress text, reusing the precomputed strings."""
+    return _PROGRESS_TEXT[current] if 0 <= current <= 10 else f"{current}/10"
 
 
-class GrapeWidget(QWidget):
+class GrapeWidget(RefreshMixin, QWidget):
     """Widget for displaying grape collection stats."""
 
     def __init__(self, db: Database):
@@ -19,12 +43,25 @@ class GrapeWidget(QWidget):
         """
         super().__init__()
         self.db = db
+        # (db.version, day) of the last render, and of the read in flight; see refresh
+        self._rendered_version = None
+        self._requested_version = None
+        self._init_refresh()
         self._init_ui()
         self.refresh()
 
     def _init_ui(self):
         """Initialize UI components with 2x2 grid layout."""
         self.setMinimumWidth(320)
+        # One rule for all stage boxes instead of a sheet per box
+        self.setStyleSheet("""
+            QFrame#stageBox {
+                border: 2px solid #E0E0E0;
+                border-radius: 10px;
+                background-color: #FAFAFA;
+                padding: 10px;
+            }
+        """)
         layout = QVBoxLayout()
         layout.setSpacing(12)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -45,53 +82,26 @@ class GrapeWidget(QWidget):
         grid = QGridLayout()
         grid.setSpacing(10)
 
-        # Stage 1: Grape Bunch (포도송이)
-        bunch_box = self._create_stage_box("🍇", "포도송이", "total_bunches", "current_bunch")
-        self.bunch_icon = bunch_box['icon']
-        self.bunch_name = bunch_box['name']
-        self.bunch_total = bunch_box['total']
-        self.bunch_progress = bunch_box['progress']
-        grid.addWidget(bunch_box['widget'], 0, 0)
-
-        # Stage 2: Grape Box (포도상자)
-        box_box = self._create_stage_box("📦", "포도상자", "total_boxes", "current_box")
-        self.box_icon = box_box['icon']
-        self.box_name = box_box['name']
-        self.box_total = box_box['total']
-        self.box_progress = box_box['progress']
-        grid.addWidget(box_box['widget'], 0, 1)
-
-        # Stage 3: Wine Bottle (와인병)
-        bottle_box = self._create_stage_box("🍷", "와인병", "total_bottles", "current_bottle")
-        self.bottle_icon = bottle_box['icon']
-        self.bottle_name = bottle_box['name']
-        self.bottle_total = bottle_box['total']
-        self.bottle_progress = bottle_box['progress']
-        grid.addWidget(bottle_box['widget'], 1, 0)
-
-        # Stage 4: Wine Crate (와인상자)
-        crate_box = self._create_stage_box("🍾", "와인상자", "total_crates", "current_crate")
-        self.crate_icon = crate_box['icon']
-        self.crate_name = crate_box['name']
-        self.crate_total = crate_box['total']
-        self.crate_progress = crate_box['progress']
-        grid.addWidget(crate_box['widget'], 1, 1)
+        # Stage boxes, keyed by their total column
+        self.stages = {}
+        for i, (icon, name, total_key, progress_key) in enumerate(_STAGES):
+            box = self._create_stage_box(icon, name, total_key, progress_key)
+            self.stages[total_key] = StageLabels(box['icon'], box['name'], box['total'],
+                                                 box['progress'], total_key, progress_key)
+            grid.addWidget(box['widget'], i // 2, i % 2)
 
         layout.addLayout(grid)
         layout.addStretch()
         self.setLayout(layout)
 
+        # Name labels start out shown; see resizeEvent
+        self._show_names = True
+
     def _create_stage_box(self, icon: str, name: str, total_key: str, progress_key: str) -> dict:
         """Create a stage box for the 2x2 grid."""
-        box = QGroupBox()
-        box.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #E0E0E0;
-                border-radius: 10px;
-                background-color: #FAFAFA;
-                padding: 10px;
-            }
-        """)
+        # Styled by the widget-level #stageBox rule set in _init_ui
+        box = QFrame()
+        box.setObjectName('stageBox')
 
         box_layout = QVBoxLayout()
         box_layout.setSpacing(5)
@@ -115,7 +125,7 @@ class GrapeWidget(QWidget):
         box_layout.addWidget(total_label)
 
         # Progress (e.g., "3/10")
-        progress_label = QLabel("0/10")
+        progress_label = QLabel(_PROGRESS_TEXT[0])
         progress_label.setStyleSheet("font-size: 11px; color: #666;")
         progress_label.setAlignment(Qt.AlignCenter)
         box_layout.addWidget(progress_label)
@@ -134,38 +144,56 @@ class GrapeWidget(QWidget):
         """Handle resize to hide/show name labels on small screens."""
         super().resizeEvent(event)
 
-        # Hide name labels when widget width is less than 400px
+        # Hide name labels when widget width is less than 400px; only touch
+        # them when the threshold is crossed, as each call relayouts
         show_names = self.width() >= 400
+        if show_names == self._show_names:
+            return
+        self._show_names = show_names
 
-        self.bunch_name.setVisible(show_names)
-        self.box_name.setVisible(show_names)
-        self.bottle_name.setVisible(show_names)
-        self.crate_name.setVisible(show_names)
+        for stage in self.stages.values():
+            stage.name.setVisible(show_names)
 
-    def refresh(self):
-        """Refresh grape collection display with wine progression."""
-        profile = self.db.get_profile()
-        today_stats = self.db.get_today_stats()
+    def refresh(self, snapshot: Optional[Snapshot] = None):
+        """
+        Refresh grape collection display with wine progression.
 
+        Args:
+            snapshot: Rows shared with sibling widgets for this refresh
+                cycle; read from the database when None
+        """
+        # Nothing was written since the last render (the day is part of the
+        # key because today's count resets at midnight without a write)
+        version = (self.db.version, date.today())
+        if version == self._rendered_version:
+            return
+        # Counts as rendered only once _on_profile_ready applies the rows
+        self._requested_version = version
+
+        # Read on a pool thread; _on_profile_ready applies the rows
+        if snapshot is None:
+            snapshot = Snapshot(self.db)
+        self._start_refresh_worker(snapshot)
+
+    def _on_profile_ready(self, payload: dict):
+        """Apply rows read by RefreshWorker, unless a newer read was started."""
+        if not self._is_current(payload):
+            return
+        self._rendered_version = self._requested_version
+        # Suspend painting so all label changes land in one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply(payload['profile'], payload['today_stats'])
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply(self, profile, today_stats):
+        """Show profile and today's stats in the labels."""
         # Update today stats
-        self.today_label.setText(f"⭐ 오늘: {today_stats['grapes_earned']}개")
-
-        # Update Stage 1: 포도송이 (Bunches)
-        self.bunch_total.setText(str(profile['total_bunches']))
-        self.bunch_progress.setText(f"{profile['current_bunch_grapes']}/10")
-
-        # Update Stage 2: 포도상자 (Boxes)
-        self.box_total.setText(str(profile['total_boxes']))
-        self.box_progress.setText(f"{profile['current_box_bunches']}/10")
-
-        # Update Stage 3: 와인병 (Wine Bottles)
-        bottles = profile.get('total_wine_bottles', 0)
-        bottle_progress = profile.get('current_bottle_boxes', 0)
-        self.bottle_total.setText(str(bottles))
-        self.bottle_progress.setText(f"{bottle_progress}/10")
-
-        # Update Stage 4: 와인상자 (Wine Crates)
-        crates = profile.get('total_wine_crates', 0)
-        crate_progress = profile.get('current_crate_bottles', 0)
-        self.crate_total.setText(str(crates))
-        self.crate_progress.setText(f"{crate_progress}/10")
+        self._set_text(self.today_label, 'today', f"⭐ 오늘: {today_stats['grapes_earned']}개")
+
+        # Update each stage's total and progress toward the next stage
+        for stage in self.stages.values():
+            self._set_text(stage.total, stage.total_key, str(profile[stage.total_key]))
+            self._set_text(stage.progress, stage.progress_key,
+                           _progress_text(profile[stage.progress_key]))
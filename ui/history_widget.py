@@ -3,17 +3,127 @@ Task history widget for Ppodo application.
 Shows completed tasks with creation and completion timestamps.
 """
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
-    QHeaderView
+    QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtGui import QColor
 from datetime import datetime
+from functools import lru_cache
 from core.database import Database
 
 
+# Rows are repainted on every scroll; each timestamp is parsed only once
+@lru_cache(maxsize=4096)
+def _fmt_ts(timestamp: str) -> str:
+    """Format a stored timestamp for display, or "N/A" when missing."""
+    if not timestamp:
+        return "N/A"
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return timestamp
+
+
+class CompletedTasksModel(QAbstractTableModel):
+    """Table model of completed tasks; cell text is built when a row is painted."""
+
+    HEADERS = ("할 일", "생성 시간", "완료 시간")
+
+    def __init__(self, parent=None):
+        """
+        Initialize an empty model.
+
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._tasks = []
+        # Task id of each row, and the same ids as a set
+        self._row_ids = []
+        self._known_ids = set()
+        self._title_color = QColor(Qt.darkGreen)
+
+    def rowCount(self, parent=QModelIndex()):
+        """Number of completed tasks shown."""
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Title, created and completed columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell text and styling, formatted on demand."""
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            task = self._tasks[index.row()]
+            if column == 0:
+                return f"✅ {task['title']}"
+            return _fmt_ts(task['created_at'] if column == 1 else task['completed_at'])
+        if role == Qt.ForegroundRole and column == 0:
+            return self._title_color
+        if role == Qt.TextAlignmentRole and column > 0:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles."""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_tasks(self, completed_tasks):
+        """
+        Bring the rows in line with the given tasks.
+
+        Rows are matched by task id: only rows of tasks that are gone are
+        removed, only new tasks get rows, and a row whose completion time
+        changed is updated in place, so views repaint just those rows.
+
+        Args:
+            completed_tasks: Completed tasks, most recent first
+        """
+        ids = [task['id'] for task in completed_tasks]
+        current = set(ids)
+
+        # Drop rows of tasks no longer listed, bottom-up so row indexes stay valid
+        for row in range(len(self._row_ids) - 1, -1, -1):
+            if self._row_ids[row] not in current:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._row_ids[row]
+                del self._tasks[row]
+                self.endRemoveRows()
+
+        # Rows that stay must already be in query order; otherwise reset
+        if [i for i in ids if i in self._known_ids] != self._row_ids:
+            self.beginResetModel()
+            self._tasks = list(completed_tasks)
+            self._row_ids = ids
+            self._known_ids = current
+            self.endResetModel()
+            return
+
+        for row, (task_id, task) in enumerate(zip(ids, completed_tasks)):
+            if task_id not in self._known_ids:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._row_ids.insert(row, task_id)
+                self._tasks.insert(row, task)
+                self.endInsertRows()
+            elif self._tasks[row]['completed_at'] != task['completed_at']:
+                self._tasks[row] = task
+                cell = self.index(row, 2)
+                self.dataChanged.emit(cell, cell, [Qt.DisplayRole])
+
+        self._known_ids = current
+
+
 class HistoryWidget(QWidget):
     """Widget for displaying completed task history."""
 
+    # Most recent completions shown in the table
+    MAX_ROWS = 500
+
     def __init__(self, db: Database):
         """
         Initialize history widget.
@@ -23,6 +133,11 @@ class HistoryWidget(QWidget):
         """
         super().__init__()
         self.db = db
+        # Coalesces request_refresh bursts into a single refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh)
         self._init_ui()
         self.refresh()
 
@@ -38,19 +153,19 @@ class HistoryWidget(QWidget):
         layout.addWidget(title)
 
         # Table for completed tasks
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["할 일", "생성 시간", "완료 시간"])
+        self.model = CompletedTasksModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Table styling
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 1px solid #E0E0E0;
                 border-radius: 5px;
                 background-color: #FFFFFF;
                 gridline-color: #F0F0F0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px;
                 border-bottom: 1px solid #F5F5F5;
             }
@@ -72,11 +187,11 @@ class HistoryWidget(QWidget):
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
 
         # Disable editing
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
 
         # Selection behavior
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
 
         layout.addWidget(self.table)
 
@@ -87,55 +202,19 @@ class HistoryWidget(QWidget):
 
         self.setLayout(layout)
 
+    def request_refresh(self):
+        """Schedule a refresh; a burst of requests collapses into one."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
     def refresh(self):
         """Refresh the completed tasks table."""
-        # Get all completed tasks
-        all_tasks = self.db.get_tasks()
-        completed_tasks = [t for t in all_tasks if t.get('completed', False)]
-
-        # Sort by completion time (most recent first)
-        completed_tasks.sort(key=lambda x: x.get('completed_at', ''), reverse=True)
-
-        # Clear table
-        self.table.setRowCount(0)
-
-        # Add tasks to table
-        for task in completed_tasks:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Task title
-            title_item = QTableWidgetItem(f"✅ {task['title']}")
-            title_item.setForeground(Qt.darkGreen)
-            self.table.setItem(row, 0, title_item)
-
-            # Creation time
-            created_at = task.get('created_at', '')
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at)
-                    formatted = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    formatted = created_at
-            else:
-                formatted = "N/A"
-            created_item = QTableWidgetItem(formatted)
-            created_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 1, created_item)
-
-            # Completion time
-            completed_at = task.get('completed_at', '')
-            if completed_at:
-                try:
-                    dt = datetime.fromisoformat(completed_at)
-                    formatted = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    formatted = completed_at
-            else:
-                formatted = "N/A"
-            completed_item = QTableWidgetItem(formatted)
-            completed_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(row, 2, completed_item)
-
-        # Update stats
-        self.stats_label.setText(f"완료된 할 일: {len(completed_tasks)}개")
+        # Most recent completions, filtered and ordered by the database
+        completed_tasks = self.db.get_completed_tasks(limit=self.MAX_ROWS)
+        self.model.set_tasks(completed_tasks)
+
+        # Update stats (count separately only when the list was cut off)
+        total = len(completed_tasks)
+        if total >= self.MAX_ROWS:
+            total = self.db.get_completed_task_count()
+        self.stats_label.setText(f"완료된 할 일: {total}개")
@@ -2,14 +2,20 @@
 Level and XP widget for Ppodo application.
 Displays user level, experience points, and streak information.
 """
+from typing import Dict, Optional, Tuple
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
 from PySide6.QtCore import Qt
-from core.database import Database
+from core.database import Database, Snapshot
+from ui.refresh_worker import RefreshMixin
 
 
-class LevelWidget(QWidget):
+class LevelWidget(RefreshMixin, QWidget):
     """Widget for displaying level, XP, and streak information."""
 
+    # (level label, XP bar) stylesheets per (color, light color or None if derived)
+    _STYLE_CACHE: Dict[Tuple[str, str], Tuple[str, str]] = {}
+
     def __init__(self, db: Database, theme_manager=None):
         """
         Initialize level widget.
@@ -21,6 +27,13 @@ class LevelWidget(QWidget):
         super().__init__()
         self.db = db
         self.theme_manager = theme_manager
+        # (maximum, value, format) last set on the XP bar
+        self._xp_state = (None, None, None)
+        # Colors of the stylesheets currently applied; see _apply_theme_styles
+        self._current_style_key = None
+        # Set by apply_theme while hidden; styles are applied on show
+        self._theme_dirty = False
+        self._init_refresh()
         self._init_ui()
         self.refresh()
 
@@ -61,23 +74,23 @@ class LevelWidget(QWidget):
         stats_layout = QHBoxLayout()
         stats_layout.setSpacing(22)
 
+        # Streak and total time share the widget-level #statsLabel rule
+        self.setStyleSheet("""
+            QLabel#statsLabel {
+                font-size: 14px;
+                font-weight: bold;
+                color: #2C3E50;
+                padding: 6px 3px 3px 3px;
+            }
+        """)
+
         # Streak
         self.streak_label = QLabel("🔥 연속: 0일")
-        self.streak_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #2C3E50;
-            padding: 6px 3px 3px 3px;
-        """)
+        self.streak_label.setObjectName('statsLabel')
 
         # Total time
         self.time_label = QLabel("⏰ 총 시간: 0.0h")
-        self.time_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #2C3E50;
-            padding: 6px 3px 3px 3px;
-        """)
+        self.time_label.setObjectName('statsLabel')
 
         stats_layout.addWidget(self.streak_label)
         stats_layout.addStretch()
@@ -92,24 +105,44 @@ class LevelWidget(QWidget):
 
     def _apply_theme_styles(self):
         """Apply theme colors to level widget."""
-        # Get theme color
+        self._theme_dirty = False
+
+        # Get theme color (the light shade is derived from it on a cache miss)
         if self.theme_manager:
             theme_color = self.theme_manager.get_focus_color()
-            theme_color_light = self._lighten_color(theme_color, 0.2)
+            theme_color_light = None
         else:
             theme_color = "#E63946"
             theme_color_light = "#FF6B6B"
 
-        # Apply to level label
-        self.level_label.setStyleSheet(f"""
+        # Restyling makes Qt reparse both sheets; skip it if the colors held
+        key = (theme_color, theme_color_light)
+        if key == self._current_style_key:
+            return
+        self._current_style_key = key
+
+        styles = self._STYLE_CACHE.get(key)
+        if styles is None:
+            if theme_color_light is None:
+                theme_color_light = self.theme_manager.lighten_color(theme_color, 0.2)
+            styles = self._STYLE_CACHE[key] = self._build_styles(theme_color, theme_color_light)
+        level_style, xp_style = styles
+        self.level_label.setStyleSheet(level_style)
+        self.xp_bar.setStyleSheet(xp_style)
+
+    @staticmethod
+    def _build_styles(theme_color: str, theme_color_light: str) -> Tuple[str, str]:
+        """Build the level label and XP bar stylesheets for a theme color."""
+        # Level label
+        level_style = f"""
             font-size: 18px;
             font-weight: bold;
             color: {theme_color};
             padding: 5px;
-        """)
+        """
 
-        # Apply to XP bar
-        self.xp_bar.setStyleSheet(f"""
+        # XP bar
+        xp_style = f"""
             QProgressBar {{
                 border: 2px solid {theme_color};
                 border-radius: 8px;
@@ -125,42 +158,71 @@ class LevelWidget(QWidget):
                                                    stop:0 {theme_color}, stop:1 {theme_color_light});
                 border-radius: 6px;
             }}
-        """)
-
-    def _lighten_color(self, hex_color: str, factor: float = 0.3) -> str:
-        """Lighten a hex color."""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-        r = min(255, int(r + (255 - r) * factor))
-        g = min(255, int(g + (255 - g) * factor))
-        b = min(255, int(b + (255 - b) * factor))
-        return f'#{r:02x}{g:02x}{b:02x}'
+        """
+        return level_style, xp_style
 
     def apply_theme(self):
-        """Apply current theme to the widget."""
-        self._apply_theme_styles()
-
-    def refresh(self):
-        """Refresh level and XP display."""
-        profile = self.db.get_profile()
+        """Apply current theme to the widget, or on next show if hidden."""
+        self._theme_dirty = True
+        if self.isVisible():
+            self._apply_theme_styles()
+
+    def showEvent(self, event):
+        """Apply a theme change that arrived while the widget was hidden."""
+        super().showEvent(event)
+        if self._theme_dirty:
+            self._apply_theme_styles()
+
+    def refresh(self, snapshot: Optional[Snapshot] = None):
+        """
+        Refresh level and XP display.
 
+        Args:
+            snapshot: Rows shared with sibling widgets for this refresh
+                cycle; read from the database when None
+        """
+        # Read on a pool thread; _on_profile_ready applies the profile
+        if snapshot is None:
+            snapshot = Snapshot(self.db)
+        self._start_refresh_worker(snapshot, with_today_stats=False)
+
+    def _on_profile_ready(self, payload: dict):
+        """Apply the profile read by RefreshWorker, unless a newer read was started."""
+        if not self._is_current(payload):
+            return
+        # Suspend painting so all label changes land in one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply(payload['profile'])
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply(self, profile):
+        """Show profile level, XP, streak and total time."""
         # Update level
         level = profile['level']
-        self.level_label.setText(f"⭐ Level {level}")
+        self._set_text(self.level_label, 'level', f"⭐ Level {level}")
 
         # Update XP bar
         current_xp = profile['xp']
         required_xp = self.db.get_xp_for_next_level(level)
 
-        self.xp_bar.setMaximum(required_xp)
-        self.xp_bar.setValue(current_xp)
-        self.xp_bar.setFormat(f"{current_xp} / {required_xp} XP")
+        # Call only the setters whose value changed; each one repaints the bar
+        old_max, old_value, old_format = self._xp_state
+        xp_format = f"{current_xp} / {required_xp} XP"
+        if required_xp != old_max:
+            self.xp_bar.setMaximum(required_xp)
+        if current_xp != old_value:
+            self.xp_bar.setValue(current_xp)
+        if xp_format != old_format:
+            self.xp_bar.setFormat(xp_format)
+        self._xp_state = (required_xp, current_xp, xp_format)
 
         # Update streak
         streak = profile['streak_days']
-        self.streak_label.setText(f"🔥 연속: {streak}일")
+        self._set_text(self.streak_label, 'streak', f"🔥 연속: {streak}일")
 
         # Update total time
-        total_minutes = profile.get('total_focus_minutes', 0)
+        total_minutes = profile['total_focus_minutes']
         total_hours = total_minutes / 60
-        self.time_label.setText(f"⏰ 총 시간: {total_hours:.1f}h")
+        self._set_text(self.time_label, 'time', f"⏰ 총 시간: {total_hours:.1f}h")
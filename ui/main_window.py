@@ -2,13 +2,17 @@
 Main window for Ppodo application.
 Integrates all widgets and manages application flow.
 """
+from string import Template
+from types import SimpleNamespace
+from typing import Dict, Optional, Tuple
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QTabWidget, QMessageBox, QComboBox, QLabel, QSplitter
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QIcon
-from core.database import Database
+from core.database import Database, Snapshot
 from core.timer import PomodoroTimer
 from core.theme import ThemeManager
 from core.i18n import LanguageManager
@@ -16,16 +20,102 @@ from ui.timer_widget import TimerWidget
 from ui.grape_widget import GrapeWidget
 from ui.level_widget import LevelWidget
 from ui.task_widget import TaskWidget
-from ui.stats_widget import StatsWidget
-from ui.badge_widget import BadgeWidget
-from ui.history_widget import HistoryWidget
-from ui.settings_dialog import SettingsDialog
-from ui.mini_window import MiniWindow
+
+# Translation keys this window shows; resolved once per language into
+# MainWindow._strings (see _rebuild_strings)
+_UI_STRING_KEYS = (
+    'app_title', 'app_name',
+    'btn_mini_mode', 'btn_toggle_tabs', 'btn_hide_tabs', 'btn_show_tabs', 'btn_settings',
+    'btn_start', 'btn_resume', 'btn_pause', 'btn_stop',
+    'tab_tasks', 'tab_history', 'tab_stats', 'tab_badges',
+    'settings_title', 'settings_cannot_change', 'settings_timer_running',
+    'msg_stop_confirm_title', 'msg_stop_confirm_message',
+)
+
+# Header and control button rules, parsed once; MainWindow._build_stylesheet
+# fills in the theme colors
+_BUTTON_QSS = Template("""
+            #miniBtn, #toggleTabsBtn, #settingsBtn {
+                color: white;
+                border: none;
+                border-radius: 5px;
+                padding: 8px 15px;
+                font-size: 13px;
+                font-weight: bold;
+            }
+            #miniBtn {
+                background-color: $focus;
+            }
+            #miniBtn:hover {
+                background-color: $focus_hover;
+            }
+            #toggleTabsBtn {
+                background-color: $break_;
+            }
+            #toggleTabsBtn:hover {
+                background-color: $break_hover;
+            }
+            #settingsBtn {
+                background-color: #95A5A6;
+            }
+            #settingsBtn:hover {
+                background-color: #7F8C8D;
+            }
+
+            #startBtn, #pauseBtn, #stopBtn {
+                font-size: 15px;
+                font-weight: bold;
+                color: white;
+                border: none;
+                border-radius: 8px;
+            }
+            #startBtn {
+                background-color: $focus;
+            }
+            #startBtn:hover {
+                background-color: $focus_hover;
+            }
+            #pauseBtn {
+                background-color: $pause;
+            }
+            #pauseBtn:hover {
+                background-color: $pause_hover;
+            }
+            #stopBtn {
+                background-color: $break_;
+            }
+            #stopBtn:hover {
+                background-color: $break_hover;
+            }
+            #pauseBtn:disabled, #stopBtn:disabled {
+                background-color: #BDC3C7;
+            }
+        """)
+
+# Window-only messages not in the locale files, per language code
+_LOCALIZED_MESSAGES = {
+    'theme_label': {
+        'ko': "🎨 테마:",
+        'en': "🎨 Theme:",
+        'ja': "🎨 テーマ:",
+    },
+    'language_changed': {
+        'ko': "언어가 변경되었습니다. 일부 UI 요소는 애플리케이션을 다시 시작해야 완전히 적용됩니다.",
+        'en': "Language changed. Some UI elements require restarting the application for full effect.",
+        'ja': "言語が変更されました。一部のUI要素は、アプリケーションを再起動すると完全に適用されます。",
+    },
+}
+
+# Translation key of each tab's label, in tab order
+_TAB_LABEL_KEYS = ('tab_tasks', 'tab_history', 'tab_stats', 'tab_badges')
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Background session write finished: (future, collect_grape, old_level)
+    _session_saved = Signal(object, bool, object)
+
     def __init__(self):
         """Initialize main window."""
         super().__init__()
@@ -38,6 +128,10 @@ class MainWindow(QMainWindow):
         # Initialize language manager with saved preference
         saved_language = self.db.get_language()
         self.lang_manager = LanguageManager(saved_language)
+        # Active language code (normalized by the manager); updated only
+        # where the language is changed, in _show_settings
+        self._lang_code = self.lang_manager.get_current_language()
+        self._rebuild_strings()
 
         # Current session info
         self.current_session_id = None
@@ -51,13 +145,25 @@ class MainWindow(QMainWindow):
         # Tabs visible state
         self.tabs_visible = True
 
+        # Set while a theme change is waiting to be applied
+        self._theme_apply_pending = False
+        # Full window stylesheet per (theme name, focus mode)
+        self._qss_cache: Dict[Tuple[str, bool], str] = {}
+        # Stylesheet currently set on the window
+        self._last_main_qss = None
+
+        # Tab widgets that skipped a refresh while hidden
+        self._dirty_widgets = set()
+
+        # Set once _init_ui has created every widget
+        self._ui_built = False
         self._init_ui()
         self._connect_signals()
         self._apply_theme()
 
     def _init_ui(self):
         """Initialize UI components."""
-        self.setWindowTitle(self.lang_manager.t('app_title'))
+        self.setWindowTitle(self._strings.app_title)
         # Better sizing for various resolutions including 1920x1080
         self.setMinimumSize(800, 600)
         self.resize(1000, 700)  # Default size - works well on 1920x1080
@@ -73,87 +179,39 @@ class MainWindow(QMainWindow):
         # Header with controls
         header_layout = QHBoxLayout()
 
-        app_title = f"🍇 {self.lang_manager.t('app_name')}"
-        if self.lang_manager.get_current_language() == 'ko':
-            app_title = "🍇 Ppodo (뽀도)"
-        self.title_label = QLabel(app_title)
+        self.title_label = QLabel(self._strings.header_title)
         # Purple color for grape theme (fixed, not theme-based)
         self.title_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #8B5A8D;")
         header_layout.addWidget(self.title_label)
 
         header_layout.addStretch()
 
-        # Get theme colors for header buttons
-        focus_color = self.theme_manager.get_focus_color()
-        break_color = self.theme_manager.get_break_color()
-        focus_hover = self._darken_color(focus_color, 0.15)
-        break_hover = self._darken_color(break_color, 0.15)
+        # Header and control buttons are styled by object name in the
+        # window stylesheet; see _build_stylesheet
 
         # Mini mode button - uses focus color
-        self.mini_button = QPushButton(self.lang_manager.t('btn_mini_mode'))
+        self.mini_button = QPushButton(self._strings.btn_mini_mode)
+        self.mini_button.setObjectName("miniBtn")
         self.mini_button.setToolTip("Mini clock mode")
         self.mini_button.clicked.connect(self._show_mini_mode)
-        self.mini_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {focus_color};
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {focus_hover};
-            }}
-        """)
         header_layout.addWidget(self.mini_button)
 
         # Toggle tabs button - uses break color
-        self.toggle_tabs_button = QPushButton(self.lang_manager.t('btn_toggle_tabs'))
+        self.toggle_tabs_button = QPushButton(self._strings.btn_toggle_tabs)
+        self.toggle_tabs_button.setObjectName("toggleTabsBtn")
         self.toggle_tabs_button.setToolTip("Toggle task/stats/badge panels")
         self.toggle_tabs_button.clicked.connect(self._toggle_tabs)
-        self.toggle_tabs_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {break_color};
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {break_hover};
-            }}
-        """)
         header_layout.addWidget(self.toggle_tabs_button)
 
         # Settings button - uses neutral gray
-        self.settings_button = QPushButton(self.lang_manager.t('btn_settings'))
+        self.settings_button = QPushButton(self._strings.btn_settings)
+        self.settings_button.setObjectName("settingsBtn")
         self.settings_button.setToolTip("Timer and language settings")
         self.settings_button.clicked.connect(self._show_settings)
-        self.settings_button.setStyleSheet("""
-            QPushButton {
-                background-color: #95A5A6;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7F8C8D;
-            }
-        """)
         header_layout.addWidget(self.settings_button)
 
         # Theme selector
-        theme_text = "🎨 " + ("테마:" if self.lang_manager.get_current_language() == 'ko'
-                             else "Theme:" if self.lang_manager.get_current_language() == 'en'
-                             else "テーマ:")
-        theme_label = QLabel(theme_text)
+        theme_label = QLabel(self._strings.theme_label)
         theme_label.setStyleSheet("font-size: 13px;")
         header_layout.addWidget(theme_label)
 
@@ -194,19 +252,18 @@ class MainWindow(QMainWindow):
 
         # Task tab
         self.task_widget = TaskWidget(self.db, self.theme_manager)
-        self.tabs.addTab(self.task_widget, self.lang_manager.t('tab_tasks'))
-
-        # History tab
-        self.history_widget = HistoryWidget(self.db)
-        self.tabs.addTab(self.history_widget, "📜 기록")
-
-        # Stats tab
-        self.stats_widget = StatsWidget(self.db)
-        self.tabs.addTab(self.stats_widget, self.lang_manager.t('tab_stats'))
-
-        # Badge tab
-        self.badge_widget = BadgeWidget(self.db)
-        self.tabs.addTab(self.badge_widget, self.lang_manager.t('tab_badges'))
+        self.tabs.addTab(self.task_widget, self._strings.tab_labels[0])
+
+        # History, stats and badge tabs start as placeholders; each real
+        # widget (and its queries) is built the first time its tab is opened
+        self.history_widget = None
+        self.stats_widget = None
+        self.badge_widget = None
+        for label in self._strings.tab_labels[1:]:
+            self.tabs.addTab(QWidget(), label)
+        self._tab_factories = {1: self._make_history, 2: self._make_stats, 3: self._make_badges}
+        self.tabs.currentChanged.connect(self._materialize_tab)
+        self.tabs.currentChanged.connect(self._refresh_dirty_tab)
 
         self.content_splitter.addWidget(self.tabs)
         self.content_splitter.setSizes([400, 600])
@@ -216,22 +273,22 @@ class MainWindow(QMainWindow):
         # Control buttons
         button_layout = QHBoxLayout()
 
-        self.start_button = QPushButton(self.lang_manager.t('btn_start'))
+        self.start_button = QPushButton(self._strings.btn_start)
+        self.start_button.setObjectName("startBtn")
         self.start_button.clicked.connect(self._on_start)
         self.start_button.setMinimumHeight(45)
-        # Style will be set by _apply_theme()
 
-        self.pause_button = QPushButton(self.lang_manager.t('btn_pause'))
+        self.pause_button = QPushButton(self._strings.btn_pause)
+        self.pause_button.setObjectName("pauseBtn")
         self.pause_button.clicked.connect(self._on_pause)
         self.pause_button.setEnabled(False)
         self.pause_button.setMinimumHeight(45)
-        # Style will be set by _apply_theme()
 
-        self.stop_button = QPushButton(self.lang_manager.t('btn_stop'))
+        self.stop_button = QPushButton(self._strings.btn_stop)
+        self.stop_button.setObjectName("stopBtn")
         self.stop_button.clicked.connect(self._on_stop)
         self.stop_button.setEnabled(False)
         self.stop_button.setMinimumHeight(45)
-        # Style will be set by _apply_theme()
 
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.pause_button)
@@ -240,228 +297,249 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(button_layout)
 
         central_widget.setLayout(main_layout)
+        self._ui_built = True
+
+    def _make_history(self) -> QWidget:
+        """Build the history tab widget."""
+        from ui.history_widget import HistoryWidget
+        self.history_widget = HistoryWidget(self.db)
+        return self.history_widget
+
+    def _make_stats(self) -> QWidget:
+        """Build the stats tab widget."""
+        # Imported here: matplotlib only loads once the tab is opened
+        from ui.stats_widget import StatsWidget
+        self.stats_widget = StatsWidget(self.db)
+        return self.stats_widget
+
+    def _make_badges(self) -> QWidget:
+        """Build the badge tab widget."""
+        from ui.badge_widget import BadgeWidget
+        self.badge_widget = BadgeWidget(self.db)
+        return self.badge_widget
+
+    def _materialize_tab(self, index: int):
+        """Swap a placeholder tab for its real widget the first time it is shown."""
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+
+        widget = factory()
+        label = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+
+        # Removing the current tab would switch tabs; keep that silent
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, label)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _refresh_all_widgets(self, force: bool = False):
+        """
+        Refresh the grape, level and tab widgets after the data changed.
+
+        Tab widgets that are not on screen are only marked dirty; they
+        refresh when their tab is shown again.
+
+        Args:
+            force: Refresh hidden tab widgets right away as well
+        """
+        # Grape and level views share one profile read
+        snapshot = Snapshot(self.db)
+        self.grape_widget.request_refresh(snapshot)
+        self.level_widget.request_refresh(snapshot)
+
+        self.setUpdatesEnabled(False)
+        try:
+            for widget in (self.badge_widget, self.stats_widget, self.history_widget):
+                # Tabs not opened yet have no widget; they load fresh when built
+                if widget is None:
+                    continue
+                if force or widget.isVisible():
+                    self._dirty_widgets.discard(widget)
+                    # The history table coalesces its reloads
+                    if widget is self.history_widget:
+                        widget.request_refresh()
+                    else:
+                        widget.refresh()
+                else:
+                    self._dirty_widgets.add(widget)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _refresh_dirty_tab(self, index: int):
+        """Refresh a tab's widget if it missed a refresh while hidden."""
+        widget = self.tabs.widget(index)
+        if widget in self._dirty_widgets and widget.isVisible():
+            self._dirty_widgets.discard(widget)
+            widget.refresh()
 
     def _connect_signals(self):
         """Connect signals and slots."""
         # Timer signals
         self.timer.focus_completed.connect(self._on_focus_completed)
         self.timer.break_completed.connect(self._on_break_completed)
+        self._session_saved.connect(self._on_session_saved)
 
         # Task selection signal
         self.task_widget.task_selected.connect(self._on_task_selected)
 
     def _apply_theme(self):
         """Apply current theme to the application."""
-        is_focus = self.timer.is_focus()
-        stylesheet = self.theme_manager.apply_stylesheet("main", is_focus)
-        self.setStyleSheet(stylesheet)
-
-        # Keep app title purple (grape theme) - don't change it
-        # The purple color is set in _init_ui and stays fixed
-
-        # Apply to level widget
-        if hasattr(self, 'level_widget'):
-            self.level_widget.apply_theme()
-
-        # Apply to timer widget
-        if hasattr(self, 'timer_widget'):
-            self.timer_widget.apply_theme()
-
-        # Apply to task widget
-        if hasattr(self, 'task_widget'):
-            self.task_widget.apply_theme()
-
-        # Apply to mini window if exists
-        if self.mini_window and self.mini_window.isVisible():
-            self.mini_window.apply_theme()
-
-        # Apply theme colors to control buttons
-        if hasattr(self, 'start_button'):
-            self._update_button_styles()
-
-        # Apply theme colors to header buttons
-        if hasattr(self, 'mini_button') and hasattr(self, 'toggle_tabs_button'):
-            self._update_header_button_styles()
-
-    def _update_header_button_styles(self):
-        """Update header button styles (mini mode, toggle tabs) based on current theme."""
-        focus_color = self.theme_manager.get_focus_color()
-        break_color = self.theme_manager.get_break_color()
-        focus_hover = self._darken_color(focus_color, 0.15)
-        break_hover = self._darken_color(break_color, 0.15)
-
-        # Mini button uses focus color
-        self.mini_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {focus_color};
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {focus_hover};
-            }}
-        """)
+        # Restyle the window and its children with painting held off, so
+        # the window paints once with the final styles
+        self.setUpdatesEnabled(False)
+        try:
+            is_focus = self.timer.is_focus()
+            # One sheet at the window root: the theme's base rules plus the
+            # header/control button rules, so a theme change repolishes once
+            key = (self.theme_manager.current_theme_name, is_focus)
+            stylesheet = self._qss_cache.get(key)
+            if stylesheet is None:
+                stylesheet = self.theme_manager.build_app_stylesheet(is_focus) + self._build_stylesheet(
+                    self.theme_manager.get_focus_color(), self.theme_manager.get_break_color())
+                self._qss_cache[key] = stylesheet
+            # Setting an identical sheet still repolishes every child
+            if stylesheet != self._last_main_qss:
+                self.setStyleSheet(stylesheet)
+                self._last_main_qss = stylesheet
+
+            # Keep app title purple (grape theme) - don't change it
+            # The purple color is set in _init_ui and stays fixed
+
+            if self._ui_built:
+                # Apply to level, timer and task widgets
+                self.level_widget.apply_theme()
+                self.timer_widget.apply_theme()
+                self.task_widget.apply_theme()
+
+            # Apply to mini window if exists
+            if self.mini_window and self.mini_window.isVisible():
+                self.mini_window.apply_theme()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_stylesheet(self, focus_color: str, break_color: str) -> str:
+        """
+        Build the header and control button rules for the window stylesheet.
+
+        Args:
+            focus_color: Theme focus color (mini mode and start buttons)
+            break_color: Theme break color (toggle tabs and stop buttons)
+
+        Returns:
+            QSS with one #objectName block per button
+        """
+        return _BUTTON_QSS.substitute(
+            focus=focus_color,
+            focus_hover=self.theme_manager.darken_color(focus_color, 0.15),
+            break_=break_color,
+            break_hover=self.theme_manager.darken_color(break_color, 0.15),
+            # Pause uses a fixed contrasting color (amber/orange)
+            pause="#F39C12",
+            pause_hover="#E67E22",
+        )
 
-        # Toggle tabs button uses break color
-        self.toggle_tabs_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {break_color};
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 15px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {break_hover};
-            }}
-        """)
+    def _rebuild_strings(self):
+        """Resolve every string this window shows for the current language."""
+        t = self.lang_manager.t
+        self._strings = SimpleNamespace(**{key: t(key) for key in _UI_STRING_KEYS})
+
+        lang = self._lang_code
+        strings = self._strings
+        strings.tab_labels = tuple(getattr(strings, key) for key in _TAB_LABEL_KEYS)
+        # (hide, show) labels of the toggle tabs button
+        self._toggle_labels = (strings.btn_hide_tabs, strings.btn_show_tabs)
+        strings.header_title = "🍇 Ppodo (뽀도)" if lang == 'ko' else f"🍇 {strings.app_name}"
+        strings.theme_label = self._msg('theme_label')
+        strings.language_changed = self._msg('language_changed')
+
+    def _msg(self, key: str) -> str:
+        """
+        Look up a window-only message in the current language.
+
+        Args:
+            key: Key in _LOCALIZED_MESSAGES
+
+        Returns:
+            Message text for the active language
+        """
+        return _LOCALIZED_MESSAGES[key][self._lang_code]
 
     def _refresh_ui_language(self):
         """Refresh all UI elements with current language."""
-        # Update window title
-        self.setWindowTitle(self.lang_manager.t('app_title'))
-
-        # Update buttons
-        if hasattr(self, 'start_button'):
-            if self.timer.is_paused():
-                self.start_button.setText(self.lang_manager.t('btn_resume'))
-            else:
-                self.start_button.setText(self.lang_manager.t('btn_start'))
-        if hasattr(self, 'pause_button'):
-            self.pause_button.setText(self.lang_manager.t('btn_pause'))
-        if hasattr(self, 'stop_button'):
-            self.stop_button.setText(self.lang_manager.t('btn_stop'))
-
-        # Update toolbar buttons
-        if hasattr(self, 'settings_button'):
-            self.settings_button.setText(self.lang_manager.t('btn_settings'))
-        if hasattr(self, 'toggle_tabs_button'):
-            self.toggle_tabs_button.setText(self.lang_manager.t('btn_toggle_tabs'))
-        if hasattr(self, 'mini_mode_button'):
-            self.mini_mode_button.setText(self.lang_manager.t('btn_mini_mode'))
-
-        # Update tab labels
-        if hasattr(self, 'tabs'):
-            self.tabs.setTabText(0, self.lang_manager.t('tab_tasks'))
-            self.tabs.setTabText(1, self.lang_manager.t('tab_stats'))
-            self.tabs.setTabText(2, self.lang_manager.t('tab_grapes'))
-            self.tabs.setTabText(3, self.lang_manager.t('tab_level'))
-            self.tabs.setTabText(4, self.lang_manager.t('tab_badges'))
+        self._rebuild_strings()
+
+        # Relabel everything with painting held off; one repaint at the end
+        self.setUpdatesEnabled(False)
+        try:
+            # Update window title
+            self.setWindowTitle(self._strings.app_title)
+
+            if self._ui_built:
+                # Update buttons
+                if self.timer.is_paused():
+                    self.start_button.setText(self._strings.btn_resume)
+                else:
+                    self.start_button.setText(self._strings.btn_start)
+                self.pause_button.setText(self._strings.btn_pause)
+                self.stop_button.setText(self._strings.btn_stop)
+
+                # Update toolbar buttons
+                self.settings_button.setText(self._strings.btn_settings)
+                self.toggle_tabs_button.setText(self._strings.btn_toggle_tabs)
+                self.mini_button.setText(self._strings.btn_mini_mode)
+
+                # Update tab labels
+                for index, label in enumerate(self._strings.tab_labels):
+                    self.tabs.setTabText(index, label)
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Notify widgets to refresh (implement language support in widgets later)
         # For now, show a message that restart is recommended
         QMessageBox.information(
             self,
-            self.lang_manager.t('settings_title'),
-            "언어가 변경되었습니다. 일부 UI 요소는 애플리케이션을 다시 시작해야 완전히 적용됩니다." if self.lang_manager.get_current_language() == 'ko'
-            else "Language changed. Some UI elements require restarting the application for full effect." if self.lang_manager.get_current_language() == 'en'
-            else "言語が変更されました。一部のUI要素は、アプリケーションを再起動すると完全に適用されます。"
+            self._strings.settings_title,
+            self._strings.language_changed
         )
 
     def _on_theme_changed(self, theme_name: str):
         """Handle theme change."""
         self.theme_manager.set_theme(theme_name)
+        # Apply on the next event loop turn, so a burst of selections
+        # restyles the window only once, for the last theme picked
+        if not self._theme_apply_pending:
+            self._theme_apply_pending = True
+            QTimer.singleShot(0, self._do_apply_theme)
+
+    def _do_apply_theme(self):
+        """Apply the theme selected since the last apply."""
+        self._theme_apply_pending = False
         self._apply_theme()
 
-    def _update_button_styles(self):
-        """Update control button styles based on current theme."""
-        # Get theme colors
-        focus_color = self.theme_manager.get_focus_color()
-        break_color = self.theme_manager.get_break_color()
-
-        # Use focus color for start button
-        start_color = focus_color
-        start_hover = self._darken_color(focus_color, 0.15)
-
-        # Use a contrasting color for pause (amber/orange)
-        pause_color = "#F39C12"
-        pause_hover = "#E67E22"
-
-        # Use break color for stop button
-        stop_color = break_color
-        stop_hover = self._darken_color(break_color, 0.15)
-
-        # Apply styles
-        self.start_button.setStyleSheet(f"""
-            QPushButton {{
-                font-size: 15px;
-                font-weight: bold;
-                background-color: {start_color};
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {start_hover};
-            }}
-        """)
-
-        self.pause_button.setStyleSheet(f"""
-            QPushButton {{
-                font-size: 15px;
-                font-weight: bold;
-                background-color: {pause_color};
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {pause_hover};
-            }}
-            QPushButton:disabled {{
-                background-color: #BDC3C7;
-            }}
-        """)
-
-        self.stop_button.setStyleSheet(f"""
-            QPushButton {{
-                font-size: 15px;
-                font-weight: bold;
-                background-color: {stop_color};
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }}
-            QPushButton:hover {{
-                background-color: {stop_hover};
-            }}
-            QPushButton:disabled {{
-                background-color: #BDC3C7;
-            }}
-        """)
-
-    def _darken_color(self, hex_color: str, factor: float = 0.2) -> str:
-        """Darken a hex color."""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-        r = int(r * (1 - factor))
-        g = int(g * (1 - factor))
-        b = int(b * (1 - factor))
-        return f'#{r:02x}{g:02x}{b:02x}'
-
     def _show_settings(self):
         """Show settings dialog."""
         # Don't allow changing settings while timer is running
         if self.timer.is_running():
             QMessageBox.warning(
                 self,
-                self.lang_manager.t('settings_cannot_change'),
-                self.lang_manager.t('settings_timer_running')
+                self._strings.settings_cannot_change,
+                self._strings.settings_timer_running
             )
             return
 
         # Get current durations and language
         focus_mins = self.timer.focus_duration // 60
         break_mins = self.timer.break_duration // 60
-        current_lang = self.lang_manager.get_current_language()
+        current_lang = self._lang_code
 
-        # Show dialog
+        # Show dialog (imported on first use to keep startup light)
+        from ui.settings_dialog import SettingsDialog
         dialog = SettingsDialog(
             focus_mins, break_mins, current_lang,
             self.lang_manager, self.theme_manager, self
@@ -473,6 +551,7 @@ class MainWindow(QMainWindow):
             # Handle language change
             if language != current_lang:
                 self.lang_manager.set_language(language)
+                self._lang_code = self.lang_manager.get_current_language()
                 self.db.set_language(language)
                 self._refresh_ui_language()
 
@@ -489,17 +568,17 @@ class MainWindow(QMainWindow):
         """Toggle tabs panel visibility."""
         self.tabs_visible = not self.tabs_visible
 
+        self.tabs.setVisible(self.tabs_visible)
+        self.toggle_tabs_button.setText(self._toggle_labels[not self.tabs_visible])
         if self.tabs_visible:
-            self.tabs.show()
-            self.toggle_tabs_button.setText("👁️ 탭 숨기기")
-        else:
-            self.tabs.hide()
-            self.toggle_tabs_button.setText("👁️ 탭 보이기")
+            self._refresh_dirty_tab(self.tabs.currentIndex())
 
     def _show_mini_mode(self):
         """Show mini clock mode window."""
         # Create mini window if not exists
         if self.mini_window is None:
+            # Imported on first use to keep startup light
+            from ui.mini_window import MiniWindow
             self.mini_window = MiniWindow(self.timer, self.theme_manager, self.lang_manager)
             self.mini_window.restore_requested.connect(self._restore_from_mini)
             self.mini_window.stop_requested.connect(self._on_stop)
@@ -591,8 +670,8 @@ class MainWindow(QMainWindow):
         if self.timer.is_running() or self.timer.is_paused():
             reply = QMessageBox.question(
                 self,
-                self.lang_manager.t('msg_stop_confirm_title'),
-                self.lang_manager.t('msg_stop_confirm_message'),
+                self._strings.msg_stop_confirm_title,
+                self._strings.msg_stop_confirm_message,
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
@@ -623,19 +702,65 @@ class MainWindow(QMainWindow):
 
     def _on_focus_completed(self):
         """Handle focus session completion."""
-        duration = self.timer.focus_duration // 60
+        # Update button states (break starts automatically)
+        self.start_button.setEnabled(False)
+        self.pause_button.setEnabled(True)
+        self.stop_button.setEnabled(True)
+
+        # Clear current task
+        self.timer_widget.set_current_task("")
+        # Also clear mini window task if it exists
+        if self.mini_window:
+            self.mini_window.set_current_task("")
 
-        # Complete session in database (with or without grape collection)
-        if self.current_session_id:
-            self.db.complete_session(self.current_session_id, self.collect_grapes_on_complete)
+        collect = self.collect_grapes_on_complete
+        if not self.current_session_id:
+            # Nothing to record; the dialog still waits for the next
+            # event loop turn so the timer's signal handler returns first
+            message = self._build_completion_message(collect)
+            QTimer.singleShot(0, lambda: self._show_completion_ui(message))
+            return
 
-        # Build completion message
-        if self.collect_grapes_on_complete:
-            # Check for new badges
-            new_badges = self.db.check_and_award_badges()
+        # Complete the session and award badges on the database worker
+        # thread; the level before the write tells whether it leveled up
+        old_level = self.db.get_profile()['level'] if collect else None
+        future = self.db.submit_session_completion(self.current_session_id, collect)
+        # Done callbacks run on the worker thread; the signal is queued
+        # back to the GUI thread
+        future.add_done_callback(lambda done: self._session_saved.emit(done, collect, old_level))
+
+    def _on_session_saved(self, future, collect: bool, old_level):
+        """
+        Show the results of a session write finished in the background.
+
+        Args:
+            future: Future from Database.submit_session_completion
+            collect: Whether the session collected a grape
+            old_level: Level before the write, or None without a grape
+        """
+        new_profile, new_badges = future.result()
+        self._show_completion_ui(
+            self._build_completion_message(collect, old_level, new_profile, new_badges))
+
+    def _build_completion_message(self, collect: bool, old_level: Optional[int] = None,
+                                  new_profile=None, new_badges=()) -> str:
+        """
+        Build the completion dialog message for a finished focus session.
+
+        Args:
+            collect: Whether the session collected a grape
+            old_level: Level before the session was recorded, if known
+            new_profile: Profile row after the session was recorded, if any
+            new_badges: Badges earned by the session
+
+        Returns:
+            Message for the completion dialog
+        """
+        duration = self.timer.focus_duration // 60
 
+        # Build completion message
+        if collect:
             # Show completion message with grape
-            profile = self.db.get_profile()
             message = f"""🎉 집중 완료!
 
 🔥 {duration}분 집중 완료!
@@ -643,9 +768,7 @@ class MainWindow(QMainWindow):
 💫 경험치 +10 XP"""
 
             # Check for level up
-            old_level = profile['level']
-            new_profile = self.db.get_profile()
-            if new_profile['level'] > old_level:
+            if old_level is not None and new_profile is not None and new_profile['level'] > old_level:
                 message += f"\n\n🎉 레벨업! Level {new_profile['level']} 달성!"
 
             # Check for new badges
@@ -664,26 +787,18 @@ class MainWindow(QMainWindow):
 
         break_mins = self.timer.break_duration // 60
         message += f"\n\n이제 {break_mins}분 휴식하세요."
+        return message
 
-        QMessageBox.information(self, "집중 완료", message)
-
-        # Refresh all widgets
-        self.grape_widget.refresh()
-        self.level_widget.refresh()
-        self.badge_widget.refresh()
-        self.stats_widget.refresh()
-        self.history_widget.refresh()
+    def _show_completion_ui(self, message: str):
+        """
+        Refresh the widgets for the completed session, then show its dialog.
 
-        # Update button states (break starts automatically)
-        self.start_button.setEnabled(False)
-        self.pause_button.setEnabled(True)
-        self.stop_button.setEnabled(True)
+        Args:
+            message: Completion message built by _build_completion_message
+        """
+        self._refresh_all_widgets()
 
-        # Clear current task
-        self.timer_widget.set_current_task("")
-        # Also clear mini window task if it exists
-        if self.mini_window:
-            self.mini_window.set_current_task("")
+        QMessageBox.information(self, "집중 완료", message)
 
     def _on_break_completed(self):
         """Handle break completion."""
@@ -714,12 +829,21 @@ class MainWindow(QMainWindow):
             if self.mini_window:
                 self.mini_window.set_current_task(task_title)
 
+    def showEvent(self, event):
+        """Catch up on a refresh the current tab missed while the window was hidden."""
+        super().showEvent(event)
+        if self._ui_built:
+            self._refresh_dirty_tab(self.tabs.currentIndex())
+
     def closeEvent(self, event):
         """Handle window close event."""
         # Close mini window if exists
         if self.mini_window:
             self.mini_window.close()
 
+        # Let background widget refreshes finish reading before closing
+        QThreadPool.globalInstance().waitForDone()
+
         # Close database connection
         self.db.close()
         event.accept()
@@ -31,6 +31,8 @@ class MiniWindow(QWidget):
         self.timer = timer
         self.theme_manager = theme_manager
         self.lang_manager = lang_manager
+        # Whether the timer signals are connected (only while shown)
+        self._updates_active = False
 
         # Window flags for always on top and frameless
         self.setWindowFlags(
@@ -238,8 +240,35 @@ class MiniWindow(QWidget):
 
     def _connect_signals(self):
         """Connect timer signals."""
+        self.resume_updates()
+
+    def pause_updates(self):
+        """Stop following the timer; the hidden window skips every tick."""
+        if not self._updates_active:
+            return
+        self._updates_active = False
+        self.timer.tick.disconnect(self.update_display)
+        self.timer.state_changed.disconnect(self.update_state)
+
+    def resume_updates(self):
+        """Follow the timer again and catch up on what was missed while hidden."""
+        if self._updates_active:
+            return
+        self._updates_active = True
         self.timer.tick.connect(self.update_display)
         self.timer.state_changed.connect(self.update_state)
+        self.update_display()
+        self.update_state(self.timer.get_state_name())
+
+    def showEvent(self, event):
+        """Resume timer updates when the window is shown."""
+        super().showEvent(event)
+        self.resume_updates()
+
+    def hideEvent(self, event):
+        """Pause timer updates while the window is hidden or closed."""
+        super().hideEvent(event)
+        self.pause_updates()
 
     def _on_start_pause(self):
         """Handle start/pause button click."""
@@ -356,4 +385,4 @@ class MiniWindow(QWidget):
     def apply_theme(self):
         """Apply theme (called when theme changes)."""
         self._apply_theme()
-        self.update_state(self.timer.state.value if hasattr(self.timer, 'state') else "idle")
+        self.update_state(self.timer.get_state_name() if hasattr(self.timer, 'state') else "idle")
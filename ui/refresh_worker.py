@@ -0,0 +1,110 @@
+"""
+Background refresh worker for Ppodo application.
+Reads the rows a widget shows on a pool thread so the GUI thread only applies them.
+"""
+from typing import Optional
+
+from PySide6.QtWidgets import QLabel
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from core.database import Snapshot
+
+
+class WorkerSignals(QObject):
+    """Signals of RefreshWorker; create on the GUI thread so slots run there."""
+
+    # {'seq': int, 'profile': dict, 'today_stats': dict (only if requested)}
+    profile_ready = Signal(dict)
+
+
+class RefreshWorker(QRunnable):
+    """Reads a snapshot's rows off the GUI thread and emits them as plain dicts."""
+
+    def __init__(self, signals: WorkerSignals, snapshot: Snapshot, seq: int,
+                 with_today_stats: bool = True):
+        """
+        Initialize refresh worker.
+
+        Args:
+            signals: Signals to emit the rows through
+            snapshot: Snapshot to read (shared snapshots are read once)
+            seq: Request number, echoed in the payload so stale reads can be dropped
+            with_today_stats: Whether to include today's statistics
+        """
+        super().__init__()
+        self.signals = signals
+        self.snapshot = snapshot
+        self.seq = seq
+        self.with_today_stats = with_today_stats
+
+    def run(self):
+        """Read the rows and emit them."""
+        payload = {'seq': self.seq, 'profile': dict(self.snapshot.profile)}
+        if self.with_today_stats:
+            payload['today_stats'] = dict(self.snapshot.today_stats)
+        self.signals.profile_ready.emit(payload)
+
+
+class RefreshMixin:
+    """Debounced background refreshes and dirty-checked label text for a widget.
+
+    Mix into a QWidget subclass that implements refresh(snapshot=None) and
+    _on_profile_ready(payload), and call _init_refresh() in __init__ before
+    the first refresh.
+    """
+
+    # Quiet time that collapses a burst of request_refresh calls, in ms
+    REFRESH_DELAY_MS = 50
+
+    def _init_refresh(self):
+        """Set up the debounce timer, worker signals and the label text cache."""
+        # Last text set per label key; see _set_text
+        self._last = {}
+        # Coalesces request_refresh bursts into a single refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._run_pending_refresh)
+        self._pending_snapshot = None
+        # Rows read by RefreshWorker come back through these signals
+        self._signals = WorkerSignals()
+        self._signals.profile_ready.connect(self._on_profile_ready)
+        # Number of the latest worker started; see _is_current
+        self._refresh_seq = 0
+
+    def request_refresh(self, snapshot: Optional[Snapshot] = None):
+        """
+        Schedule a refresh; a burst of requests collapses into one.
+
+        Args:
+            snapshot: Rows to show, as for refresh; the latest request wins
+        """
+        self._pending_snapshot = snapshot
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _run_pending_refresh(self):
+        """Run the refresh scheduled by request_refresh."""
+        snapshot, self._pending_snapshot = self._pending_snapshot, None
+        self.refresh(snapshot)
+
+    def _start_refresh_worker(self, snapshot: Snapshot, with_today_stats: bool = True):
+        """
+        Read a snapshot on a pool thread; _on_profile_ready receives the rows.
+
+        Args:
+            snapshot: Snapshot to read
+            with_today_stats: Whether to include today's statistics
+        """
+        self._refresh_seq += 1
+        QThreadPool.globalInstance().start(
+            RefreshWorker(self._signals, snapshot, self._refresh_seq, with_today_stats))
+
+    def _is_current(self, payload: dict) -> bool:
+        """Whether a payload comes from the latest worker; an older read can finish last."""
+        return payload['seq'] == self._refresh_seq
+
+    def _set_text(self, label: QLabel, key: str, text: str):
+        """Set a label's text, skipping the call when it is already shown."""
+        if self._last.get(key) != text:
+            self._last[key] = text
+            label.setText(text)
@@ -81,7 +81,7 @@ class TimerWidget(QWidget):
             "paused": "#FFB703"
         }
 
-        current_state = self.timer.state.value if hasattr(self.timer, 'state') else "idle"
+        current_state = self.timer.get_state_name() if hasattr(self.timer, 'state') else "idle"
         color = state_colors.get(current_state, "#666")
 
         self.state_label.setStyleSheet(f"""